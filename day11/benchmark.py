@@ -0,0 +1,49 @@
+#
+#  Benchmark the compiled seating machine on big made-up seating plans
+#
+#  Each plan is a random grid of seats (L) and floor (.), both neighbour rules are run
+#  for a fixed number of generations with the plain loop and with numpy.
+#
+import random
+import time
+
+from compiled_seating import CompiledSeating, neighbour_rules
+
+# (width, height) of the made-up plans
+plan_sizes = [(100, 100), (300, 300), (1000, 1000)]
+generations = 20
+seat_fraction = 0.7
+
+
+def make_plan(width, height, seed=2020):
+    """
+    Return the lines of a random seating plan
+    """
+    rng = random.Random(seed)
+    return [
+        "".join("L" if rng.random() < seat_fraction else "." for x in range(width))
+        for y in range(height)
+    ]
+
+
+def time_generations(seating, use_numpy):
+    step = seating.step_numpy if use_numpy else seating.step
+    start_time = time.perf_counter()
+    for _ in range(generations):
+        step()
+    return time.perf_counter() - start_time
+
+
+# main
+if __name__ == "__main__":
+    for width, height in plan_sizes:
+        lines = make_plan(width, height)
+        for rule in neighbour_rules:
+            for use_numpy in (False, True):
+                seating = CompiledSeating.from_lines(lines, rule)
+                elapsed = time_generations(seating, use_numpy)
+                seat_updates = seating.seat_count() * generations
+                print(
+                    f"size={width}x{height} rule={rule:13} numpy={str(use_numpy):5} seats={seating.seat_count():7} "
+                    f"generations/sec={generations / elapsed:9.2f} seat updates/sec={seat_updates / elapsed:12.0f}"
+                )
@@ -0,0 +1,215 @@
+#
+#  A compiled version of the seating machine
+#
+#  Seats are numbered 0..N-1 and the neighbours of seat i are
+#     neighbour_indexes[neighbour_offsets[i]:neighbour_offsets[i + 1]]
+#  (a CSR layout) so a generation is just a walk over two flat int arrays
+#  and a bytearray of 0 / 1 occupied flags, with no tuples or dict lookups.
+#
+#  step() is a plain python loop, step_numpy() does the whole generation as a
+#  gather + bincount, numpy is only imported if you use that one.
+#
+from array import array
+
+neighbour_directions = [
+    (-1, -1),
+    (0, -1),
+    (1, -1),
+    (-1, 0),
+    (1, 0),
+    (-1, +1),
+    (0, +1),
+    (1, +1),
+]
+
+
+def load_seat_positions(lines):
+    """
+    Return (list of (x, y) seat positions, width, height) from the lines of a seating plan
+        L -> seat
+        . -> space
+    """
+    positions = []
+    width = 0
+    y = -1
+    for this_line in lines:
+        this_line = this_line.strip()
+        if "" != this_line:
+            y += 1
+            for x, this_char in enumerate(this_line):
+                if "L" == this_char:
+                    positions.append((x, y))
+            width = max(width, len(this_line))
+    return positions, width, y + 1
+
+
+def adjacent_neighbours(positions, width, height):
+    """
+    part 1 rule, the neighbours are the seats in the 8 squares around each seat
+    """
+    seats = set(positions)
+    result = dict()
+    for x, y in positions:
+        result[(x, y)] = [
+            (x + x_increment, y + y_increment)
+            for x_increment, y_increment in neighbour_directions
+            if (x + x_increment, y + y_increment) in seats
+        ]
+    return result
+
+
+def line_of_sight_neighbours(positions, width, height):
+    """
+    part 2 rule, the neighbours are the first seat you can see in each of the 8 directions
+    """
+    seats = set(positions)
+    result = dict()
+    for x, y in positions:
+        result[(x, y)] = []
+        for x_increment, y_increment in neighbour_directions:
+            target_x = x + x_increment
+            target_y = y + y_increment
+            while 0 <= target_x < width and 0 <= target_y < height:
+                if (target_x, target_y) in seats:
+                    result[(x, y)].append((target_x, target_y))
+                    break
+                target_x += x_increment
+                target_y += y_increment
+    return result
+
+
+neighbour_rules = {
+    "adjacent": (adjacent_neighbours, 4),
+    "line_of_sight": (line_of_sight_neighbours, 5),
+}
+
+
+class CompiledSeating:
+    def __init__(self, positions, neighbours, crowded_at):
+        """
+        positions is the list of (x, y) seats, neighbours maps each (x, y) to a list of neighbouring (x, y)
+        a seat empties when crowded_at or more of its neighbours are occupied
+        """
+        self.positions = list(positions)
+        self.crowded_at = crowded_at
+        self.current_iteration = 0
+
+        seat_number = {position: idx for idx, position in enumerate(self.positions)}
+        self.neighbour_offsets = array("I", [0])
+        self.neighbour_indexes = array("I")
+        for position in self.positions:
+            self.neighbour_indexes.extend(
+                seat_number[neighbour] for neighbour in neighbours[position]
+            )
+            self.neighbour_offsets.append(len(self.neighbour_indexes))
+
+        # everyone starts empty, the next buffer is reused every generation
+        self.state = bytearray(len(self.positions))
+        self.next_state = bytearray(len(self.positions))
+
+    @classmethod
+    def from_lines(cls, lines, rule="line_of_sight"):
+        """
+        Compile a seating plan using one of the neighbour_rules
+        """
+        positions, width, height = load_seat_positions(lines)
+        neighbour_function, crowded_at = neighbour_rules[rule]
+        return cls(positions, neighbour_function(positions, width, height), crowded_at)
+
+    @classmethod
+    def from_file(cls, filename: str, rule="line_of_sight"):
+        with open(filename, "r") as f:
+            return cls.from_lines(f, rule)
+
+    def seat_count(self):
+        return len(self.positions)
+
+    def occupied_count(self):
+        return sum(self.state)
+
+    def step(self):
+        """
+        Run one generation with a plain loop over the CSR arrays, returns whether anything changed
+        """
+        state = self.state
+        next_state = self.next_state
+        offsets = self.neighbour_offsets
+        indexes = self.neighbour_indexes
+        crowded_at = self.crowded_at
+        something_changed = False
+
+        start = 0
+        for seat in range(len(state)):
+            end = offsets[seat + 1]
+            occupied_neighbours = 0
+            for k in range(start, end):
+                occupied_neighbours += state[indexes[k]]
+            start = end
+
+            if state[seat]:
+                # occupied, empties if it's too crowded
+                new_state = 0 if occupied_neighbours >= crowded_at else 1
+            else:
+                # empty, fills if nobody is around
+                new_state = 1 if 0 == occupied_neighbours else 0
+            if new_state != state[seat]:
+                something_changed = True
+            next_state[seat] = new_state
+
+        # swap the buffers round
+        self.state, self.next_state = next_state, state
+        self.current_iteration += 1
+        return something_changed
+
+    def step_numpy(self):
+        """
+        Run one generation as a numpy gather + bincount, returns whether anything changed
+        """
+        import numpy as np
+
+        if not hasattr(self, "edge_seats"):
+            # which seat each entry in neighbour_indexes belongs to, worked out once
+            offsets = np.frombuffer(self.neighbour_offsets, dtype=np.uint32)
+            self.edge_seats = np.repeat(
+                np.arange(self.seat_count(), dtype=np.intp), np.diff(offsets)
+            )
+            self.edge_neighbours = np.frombuffer(
+                self.neighbour_indexes, dtype=np.uint32
+            ).astype(np.intp)
+
+        state = np.frombuffer(self.state, dtype=np.uint8).astype(bool)
+        occupied_neighbours = np.bincount(
+            self.edge_seats,
+            weights=state[self.edge_neighbours],
+            minlength=self.seat_count(),
+        )
+        new_state = np.where(
+            state,
+            occupied_neighbours < self.crowded_at,
+            occupied_neighbours == 0,
+        )
+        something_changed = bool((new_state != state).any())
+
+        self.state = bytearray(new_state.astype(np.uint8).tobytes())
+        self.current_iteration += 1
+        return something_changed
+
+    def run_until_stable(self, use_numpy=False):
+        """
+        Keep stepping until nothing changes, returns the number of occupied seats
+        """
+        step = self.step_numpy if use_numpy else self.step
+        while step():
+            pass
+        return self.occupied_count()
+
+
+# main, the answers for the input file
+if __name__ == "__main__":
+    for rule in neighbour_rules:
+        for use_numpy in (False, True):
+            seating = CompiledSeating.from_file("input.txt", rule)
+            occupied = seating.run_until_stable(use_numpy)
+            print(
+                f"rule={rule}, numpy={use_numpy}: {occupied} occupied after {seating.current_iteration} iterations"
+            )
@@ -197,6 +197,9 @@
 # Conway tribute then..
 
 
+from compiled_seating import CompiledSeating
+
+
 class ConwayMachine:
 
     EMPTY = "L"
@@ -208,6 +211,10 @@ class ConwayMachine:
         self.width = 0
         self.height = 0
         self.current_iteration = 0
+        # for iterate_frontier, the seats that could change next time (None means all of them)
+        # and how many seats were looked at in each generation
+        self.frontier = None
+        self.seats_evaluated_per_generation = []
 
     def load_seating_plan(self, filename: str):
         """
@@ -218,6 +225,8 @@ class ConwayMachine:
         self.seats = {}
         self.width = 0
         self.height = 0
+        self.frontier = None
+        self.seats_evaluated_per_generation = []
 
         with open(filename, "r") as f:
             y = -1
@@ -328,10 +337,59 @@ class ConwayMachine:
         # and store the result
         self.seats = new_seats
         self.current_iteration += 1
+        # everything was looked at, so iterate_frontier has to start from scratch again
+        self.frontier = None
 
         # and return whether anything changed
         return something_changed
 
+    def iterate_frontier(self):
+        """
+        Run one set of the logic, but only for seats that had a neighbour (or themselves) change
+        last time, nothing else can change.  Returns whether anything changed.
+        """
+        if self.frontier is None:
+            seats_to_check = list(self.seats)
+        else:
+            seats_to_check = self.frontier
+        self.seats_evaluated_per_generation.append(len(seats_to_check))
+
+        # work out all the changes against the current state before applying any of them
+        changes = []
+        for x, y in seats_to_check:
+            current_state = self.seats[(x, y)]
+            if self.EMPTY == current_state:
+                # If a seat is empty (L) and there are no occupied seats adjacent to it, the seat becomes occupied.
+                if 0 == self.count_neighbours(x, y, stop_at=1):
+                    changes.append(((x, y), self.OCCUPIED))
+            else:
+                # If a seat is occupied (#) and five or more seats adjacent to it are also occupied, the seat becomes empty.
+                if self.count_neighbours(x, y, stop_at=5) >= 5:
+                    changes.append(((x, y), self.EMPTY))
+
+        # apply them, and the next frontier is everything that changed plus its neighbours
+        # (neighbours go both ways so that's everything that could see a change)
+        next_frontier = set()
+        for position, new_state in changes:
+            self.seats[position] = new_state
+            next_frontier.add(position)
+            next_frontier.update(self.neighbours[position])
+
+        self.frontier = next_frontier
+        self.current_iteration += 1
+
+        return 0 != len(changes)
+
+    def compile(self):
+        """
+        Return a CompiledSeating for the current plan, numbered seats with CSR neighbour arrays
+        """
+        positions = sorted(self.seats, key=lambda position: (position[1], position[0]))
+        result = CompiledSeating(positions, self.neighbours, crowded_at=5)
+        for idx, (x, y) in enumerate(positions):
+            result.state[idx] = 1 if self.seat_occupied(x, y) else 0
+        return result
+
     def print(self):
         """
         Output the current grid
@@ -355,12 +413,20 @@ class ConwayMachine:
 
 
 # main
-filename = "input.txt"
-conway = ConwayMachine()
-conway.load_seating_plan(filename)
+if __name__ == "__main__":
+    filename = "input.txt"
+    conway = ConwayMachine()
+    conway.load_seating_plan(filename)
 
-# conway.print()
-while conway.iterate():
-    conway.print()
+    # iterate_frontier only looks at seats near the last set of changes
+    use_frontier = True
+    iterate = conway.iterate_frontier if use_frontier else conway.iterate
 
-conway.print()
+    # conway.print()
+    while iterate():
+        conway.print()
+
+    conway.print()
+    if use_frontier:
+        print(f"Seats evaluated per generation: {conway.seats_evaluated_per_generation}")
+        print(f"Total seats evaluated: {sum(conway.seats_evaluated_per_generation)}")
@@ -0,0 +1,89 @@
+#
+#  Benchmark the numpy batch next departure engine against the scalar find_starting_time loop
+#
+#  Two sorts of query: lots of start times against the puzzle schedule, and lots of start times
+#  each with their own random schedule (padded with 0 to the same length).
+#  find_starting_time prints a line per bus so its output is thrown away, and it only gets a
+#  slice of the queries since it's so much slower.
+#
+import contextlib
+import io
+import time
+
+import numpy as np
+
+from day13_part1 import find_starting_time, schedule, schedule_to_list
+from departure_batch import next_departures
+
+query_counts = [10000, 1000000, 5000000]
+scalar_query_count = 20000
+buses_per_schedule = 9
+
+
+def scalar_departures(start_times, schedules):
+    """
+    The part 1 way, one query at a time
+    """
+    best_buses = []
+    best_waits = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for this_start_time, this_schedule in zip(start_times, schedules):
+            next_arrivals = find_starting_time(this_start_time, this_schedule)
+            best_time = min(next_arrivals.keys())
+            best_buses.append(next_arrivals[best_time][0])
+            best_waits.append(best_time)
+    return best_buses, best_waits
+
+
+def random_schedules(query_count, rng):
+    """
+    (queries, buses) array of bus ids, about a third of each row is 0 padding
+    """
+    bus_ids = rng.integers(2, 1000, size=(query_count, buses_per_schedule))
+    bus_ids[rng.random((query_count, buses_per_schedule)) < 0.3] = 0
+    # make sure there's a bus in every schedule
+    bus_ids[:, 0] = rng.integers(2, 1000, size=query_count)
+    return bus_ids
+
+
+def compare(description, start_times, bus_ids):
+    start_time = time.perf_counter()
+    best_buses, best_waits = next_departures(start_times, bus_ids)
+    batch_time = time.perf_counter() - start_time
+
+    # the scalar version on the first few, that's plenty to time it and check we agree
+    scalar_count = min(scalar_query_count, len(start_times))
+    if bus_ids.ndim == 1:
+        schedules = [list(bus_ids)] * scalar_count
+    else:
+        schedules = [[int(b) for b in row if b] for row in bus_ids[:scalar_count]]
+    start_time = time.perf_counter()
+    scalar_buses, scalar_waits = scalar_departures(
+        [int(t) for t in start_times[:scalar_count]], schedules
+    )
+    scalar_time = time.perf_counter() - start_time
+
+    same = scalar_buses == list(best_buses[:scalar_count]) and scalar_waits == list(
+        best_waits[:scalar_count]
+    )
+    print(
+        f"{description:40} batch={len(start_times) / batch_time:12.0f} queries/sec "
+        f"scalar={scalar_count / scalar_time:10.0f} queries/sec same={same}"
+    )
+    if not same:
+        print(f"Problem here chief..")
+        exit(1)
+
+
+# main
+if __name__ == "__main__":
+    rng = np.random.default_rng(2020)
+    puzzle_bus_ids = np.array(schedule_to_list(schedule), dtype=np.int64)
+    for query_count in query_counts:
+        start_times = rng.integers(0, 10 ** 12, size=query_count)
+        compare(f"{query_count} queries, puzzle schedule", start_times, puzzle_bus_ids)
+        compare(
+            f"{query_count} queries, own schedules",
+            start_times,
+            random_schedules(query_count, rng),
+        )
@@ -0,0 +1,102 @@
+#
+#  Chinese remainder theorem solver for the bus schedules
+#
+#  Every (bus_id, list_offset) pair says the time t has (t + list_offset) % bus_id == 0,
+#  which is the same as t == -list_offset (mod bus_id). Two of those combine into one
+#  constraint modulo the lcm of the two bus ids using extended Euclid, so folding the whole
+#  list down is one gcd per bus however big the answer is.
+#
+#  The bus ids don't have to be coprime, if two share a factor they have to agree modulo
+#  that factor or there's no time that works at all (ValueError).
+#
+
+
+def extended_gcd(a: int, b: int):
+    """
+    Return (g, x, y) with a * x + b * y == g == gcd(a, b)
+    """
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while r:
+        quotient = old_r // r
+        old_r, r = r, old_r - quotient * r
+        old_x, x = x, old_x - quotient * x
+        old_y, y = y, old_y - quotient * y
+    return old_r, old_x, old_y
+
+
+def combine_constraints(constraint_one, constraint_two):
+    """
+    Combine t == r1 (mod m1) and t == r2 (mod m2) into t == r (mod lcm(m1, m2)), returns (lcm, r)
+    """
+    modulus_one, remainder_one = constraint_one
+    modulus_two, remainder_two = constraint_two
+    g, x, _ = extended_gcd(modulus_one, modulus_two)
+    difference = remainder_two - remainder_one
+    if difference % g:
+        raise ValueError(
+            f"No time satisfies t = {remainder_one} mod {modulus_one} and t = {remainder_two} mod {modulus_two}"
+        )
+    lcm = modulus_one // g * modulus_two
+    # step from remainder_one in multiples of modulus_one until we hit remainder_two mod modulus_two
+    steps = (difference // g * x) % (modulus_two // g)
+    return lcm, (remainder_one + modulus_one * steps) % lcm
+
+
+def bus_constraint(bus_id: int, list_offset: int):
+    """
+    (t + list_offset) % bus_id == 0  ->  t == -list_offset (mod bus_id)
+    """
+    if bus_id <= 0:
+        raise ValueError(f"Bus ids have to be positive, got {bus_id}")
+    return bus_id, -list_offset % bus_id
+
+
+def solve_schedule(schedule):
+    """
+    Given the (bus_id, list_offset) list from schedule_to_list return (earliest time, period)
+    the same pattern comes round again every period minutes
+    """
+    result = (1, 0)
+    for bus_id, list_offset in schedule:
+        result = combine_constraints(result, bus_constraint(bus_id, list_offset))
+    period, earliest_time = result
+    return earliest_time, period
+
+
+# main, check against the examples from the puzzle text and some brute force
+if __name__ == "__main__":
+    from day13_part2 import attempt_0, rule_check, schedule_to_list
+
+    examples = [
+        (1068781, "7,13,x,x,59,x,31,19"),
+        (3417, "17,x,13,19"),
+        (754018, "67,7,59,61"),
+        (779210, "67,x,7,59,61"),
+        (1261476, "67,7,x,59,61"),
+        (1202161486, "1789,37,47,1889"),
+        # bus ids that share factors, brute force gives the expected result
+        (None, "4,x,6"),
+        (None, "6,x,x,x,10"),
+        (None, "6,x,x,x,10,x,x,x,x,15"),
+        (None, "x,x,12,x,x,x,8,x,18"),
+    ]
+    for expected_result, schedule in examples:
+        sched = schedule_to_list(schedule)
+        if expected_result is None:
+            expected_result, _ = attempt_0(sched)
+        result, period = solve_schedule(sched)
+        print(f"{schedule}: {result} (every {period}), expected {expected_result}")
+        if result != expected_result or not rule_check(result, sched):
+            print(f"Problem here chief..")
+            exit(1)
+
+    # buses that can never line up (4,6 wants an even time for 4 and an odd one for 6)
+    for schedule in ("4,6", "12,x,x,x,18,x,x,x,8"):
+        try:
+            solve_schedule(schedule_to_list(schedule))
+            print(f"Problem here chief..")
+            exit(1)
+        except ValueError as e:
+            print(f"{schedule}: {e}")
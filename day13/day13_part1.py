@@ -90,14 +90,15 @@ def find_starting_time(start_time, schedule):
 
 
 # main
-sched = schedule_to_list(schedule)
-print(f"Looking for a bus at {start_time} in {sched}")
-next_arrivals = find_starting_time(start_time, sched)
-best_time = min(next_arrivals.keys())
+if __name__ == "__main__":
+    sched = schedule_to_list(schedule)
+    print(f"Looking for a bus at {start_time} in {sched}")
+    next_arrivals = find_starting_time(start_time, sched)
+    best_time = min(next_arrivals.keys())
 
-# the first bus we can catch is..
-bus_options_for_best_time = next_arrivals[best_time]
-first_bus = bus_options_for_best_time[0]
-# result is multiplying them for some reason
-part1_result = first_bus * best_time
-print(f"part1_result is {part1_result}")
+    # the first bus we can catch is..
+    bus_options_for_best_time = next_arrivals[best_time]
+    first_bus = bus_options_for_best_time[0]
+    # result is multiplying them for some reason
+    part1_result = first_bus * best_time
+    print(f"part1_result is {part1_result}")
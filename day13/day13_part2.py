@@ -112,6 +112,8 @@
 #
 # What is the earliest timestamp such that all of the listed bus IDs depart at offsets matching their positions in the list?
 
+from crt_solver import solve_schedule
+
 
 def schedule_to_list(schedule):
     """
@@ -213,33 +215,46 @@ def attempt_1(schedule, cut_off_time=None, verbose=False):
     return candidate_time, checks_made
 
 
+def attempt_2(schedule):
+    """
+    approach 2: chinese remainder theorem, fold the buses together one at a time (see crt_solver.py)
+    """
+    earliest_time, period = solve_schedule(schedule)
+    # one combination per bus rather than checks
+    return earliest_time, len(schedule)
+
+
 # main
+if __name__ == "__main__":
+    # real input
+    expected_result, schedule = (
+        None,
+        "23,x,x,x,x,x,x,x,x,x,x,x,x,41,x,x,x,37,x,x,x,x,x,479,x,x,x,x,x,x,x,x,x,x,x,x,13,x,x,x,17,x,x,x,x,x,x,x,x,x,x,x,29,x,373,x,x,x,x,x,x,x,x,x,x,x,x,x,x,x,x,x,x,19",
+    )
+
+    # sample input from part 1
+    # start_time, schedule = (939, "7, 13, x, x, 59, x, 31, 19")
+
+    # first example, small result space, brute force expected to work
+    # expected_result, schedule = (3417, "17,x,13,19")
+    # larger example..
+    # expected_result, schedule = (754018, "67,7,59,61")
+    # larger again
+    # expected_result, schedule = (779210, "67,x,7,59,61")
+    # and starting to get big..
+    # expected_result, schedule = (1261476, "67,7,x,59,61")
+    # and quite large..
+    # expected_result, schedule = (1202161486, "1789,37,47,1889")
+
+    sched = schedule_to_list(schedule)
+    print(f"Scheduled and offsets are: {sched}")
+
+    # maybe we can solve this by walking the biggest number and seeing whether everything else lines up ? I'd imagine this will take too long but as a starter for 10 let's see
 
-# real input
-expected_result, schedule = (
-    None,
-    "23,x,x,x,x,x,x,x,x,x,x,x,x,41,x,x,x,37,x,x,x,x,x,479,x,x,x,x,x,x,x,x,x,x,x,x,13,x,x,x,17,x,x,x,x,x,x,x,x,x,x,x,29,x,373,x,x,x,x,x,x,x,x,x,x,x,x,x,x,x,x,x,x,19",
-)
-
-# sample input from part 1
-# start_time, schedule = (939, "7, 13, x, x, 59, x, 31, 19")
-
-# first example, small result space, brute force expected to work
-# expected_result, schedule = (3417, "17,x,13,19")
-# larger example..
-# expected_result, schedule = (754018, "67,7,59,61")
-# larger again
-# expected_result, schedule = (779210, "67,x,7,59,61")
-# and starting to get big..
-# expected_result, schedule = (1261476, "67,7,x,59,61")
-# and quite large..
-# expected_result, schedule = (1202161486, "1789,37,47,1889")
-
-sched = schedule_to_list(schedule)
-print(f"Scheduled and offsets are: {sched}")
-
-# maybe we can solve this by walking the biggest number and seeing whether everything else lines up ? I'd imagine this will take too long but as a starter for 10 let's see
-
-print(f"Expected result is {expected_result} for {sched}")
-result = attempt_1(sched, cut_off_time=expected_result, verbose=False)
-print(f"Result was {result[0]} using {result[1]} checks (expected {expected_result})")
+    print(f"Expected result is {expected_result} for {sched}")
+    use_crt = True
+    if use_crt:
+        result = attempt_2(sched)
+    else:
+        result = attempt_1(sched, cut_off_time=expected_result, verbose=False)
+    print(f"Result was {result[0]} using {result[1]} checks (expected {expected_result})")
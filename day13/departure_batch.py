@@ -0,0 +1,70 @@
+#
+#  Work out the next bus for lots of start times at once with numpy
+#
+#  The wait for bus b from time t is (-t) % b, so a whole (queries x buses) table of waits is one
+#  modulo, and the best bus for each query is an argmin along the rows. argmin picks the first
+#  of any tied buses, which is the same bus find_starting_time ends up with.
+#
+#  bus_ids can be one schedule shared by every query (shape (buses,)) or a schedule per query
+#  (shape (queries, buses)), pad short schedules with 0, a 0 is never picked.
+#
+import numpy as np
+
+
+def wait_times(start_times, bus_ids):
+    """
+    Return the (queries, buses) array of minutes until each bus next leaves after each start time
+    padding (bus id 0) gets a wait bigger than any real one
+    """
+    start_times = np.asarray(start_times, dtype=np.int64)
+    bus_ids = np.asarray(bus_ids, dtype=np.int64)
+    if bus_ids.ndim == 1:
+        bus_ids = np.broadcast_to(bus_ids, (len(start_times), len(bus_ids)))
+    if bus_ids.shape[0] != len(start_times):
+        raise ValueError(
+            f"Got {len(start_times)} start times but {bus_ids.shape[0]} schedules"
+        )
+    if (bus_ids < 0).any():
+        raise ValueError("Bus ids have to be positive (or 0 for padding)")
+
+    real_bus = bus_ids > 0
+    safe_ids = np.where(real_bus, bus_ids, 1)
+    waits = np.negative(start_times)[:, None] % safe_ids
+    return np.where(real_bus, waits, np.iinfo(np.int64).max)
+
+
+def next_departures(start_times, bus_ids):
+    """
+    Return (best bus, wait) arrays, one entry per start time
+    """
+    bus_ids = np.asarray(bus_ids, dtype=np.int64)
+    waits = wait_times(start_times, bus_ids)
+    best_column = waits.argmin(axis=1)
+    rows = np.arange(len(best_column))
+    best_waits = waits[rows, best_column]
+    if bus_ids.ndim == 1:
+        best_buses = bus_ids[best_column]
+    else:
+        best_buses = bus_ids[rows, best_column]
+    if (best_buses == 0).any():
+        raise ValueError("Every schedule needs at least one bus")
+    return best_buses, best_waits
+
+
+def part1_answers(start_times, bus_ids):
+    """
+    The part 1 answer (best bus * minutes waited) for every start time
+    """
+    best_buses, best_waits = next_departures(start_times, bus_ids)
+    return best_buses * best_waits
+
+
+# main, the answer for the puzzle input
+if __name__ == "__main__":
+    from day13_part1 import schedule, schedule_to_list, start_time
+
+    sched = schedule_to_list(schedule)
+    best_buses, best_waits = next_departures([start_time], sched)
+    print(
+        f"bus {best_buses[0]} after {best_waits[0]} minutes, part1_result is {part1_answers([start_time], sched)[0]}"
+    )
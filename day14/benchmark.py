@@ -0,0 +1,80 @@
+#
+#  Microbenchmark the floating address generators, addresses/sec for
+#     generate_addresses - rebuilds every address bit by bit into a list
+#     iterate_addresses  - Gray code, one bit flip per address, handed out one at a time
+#  and then the whole of input.txt run through DockingSystem with the dict memory.
+#  Outside the timing, both generators have to give the same set of addresses for every mask
+#  with nothing repeated, the same count isn't enough.
+#
+import random
+import time
+
+from day14_part2 import BitMask, DockingSystem
+
+floating_bit_counts = [4, 9, 12, 16]
+masks_per_count = 5
+
+
+def random_mask(floating_bits, rng):
+    mask = [rng.choice("01") for _ in range(36)]
+    for idx in rng.sample(range(36), floating_bits):
+        mask[idx] = "X"
+    return BitMask("".join(mask))
+
+
+def time_generator(generator, masks, address):
+    start_time = time.perf_counter()
+    address_count = 0
+    for mask in masks:
+        for _ in generator(mask, address):
+            address_count += 1
+    return address_count, time.perf_counter() - start_time
+
+
+def same_addresses(masks, address):
+    """
+    Every generator gives the same addresses for every mask, each one once
+    """
+    for mask in masks:
+        address_sets = []
+        for generator in generators.values():
+            addresses = list(generator(mask, address))
+            if len(set(addresses)) != len(addresses):
+                return False
+            address_sets.append(set(addresses))
+        if any(address_set != address_sets[0] for address_set in address_sets):
+            return False
+    return True
+
+
+generators = {
+    "generate_addresses": lambda mask, address: mask.generate_addresses(address),
+    "iterate_addresses": lambda mask, address: mask.iterate_addresses(address),
+}
+
+
+# main
+if __name__ == "__main__":
+    rng = random.Random(2020)
+    for floating_bits in floating_bit_counts:
+        masks = [random_mask(floating_bits, rng) for _ in range(masks_per_count)]
+        address = rng.randrange(1 << 16)
+        results = []
+        for name, generator in generators.items():
+            address_count, elapsed = time_generator(generator, masks, address)
+            results.append(address_count)
+            print(
+                f"floating bits={floating_bits:2} {name:18} addresses={address_count:8} "
+                f"time={elapsed:7.3f}s addresses/sec={address_count / elapsed:12.0f}"
+            )
+        if results[0] != results[1] or not same_addresses(masks, address):
+            print(f"Problem here chief..")
+            exit(1)
+
+    start_time = time.perf_counter()
+    docking_system = DockingSystem("dict")
+    docking_system.process_instruction_file("input.txt")
+    print(
+        f"input.txt with the dict memory: sum={docking_system.memory_sum()} "
+        f"in {time.perf_counter() - start_time:.3f}s"
+    )
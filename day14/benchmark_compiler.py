@@ -0,0 +1,70 @@
+#
+#  Benchmark reading a big docking program line by line against compiling it once and replaying
+#
+#  The program is made up, a couple of million lines drawing the masks from a small pool
+#  (with only a few X's each so the version 2 decoder isn't just writing addresses all day).
+#
+import os
+import random
+import tempfile
+import time
+
+import day14_part1
+import day14_part2
+from compiled_program import CompiledProgram
+
+line_count = 2000000
+mask_pool_size = 50
+floating_bits = 3
+decoders = {1: day14_part1.DockingSystem, 2: day14_part2.DockingSystem}
+
+
+def random_program_lines(line_count, seed=2020):
+    rng = random.Random(seed)
+    masks = []
+    for _ in range(mask_pool_size):
+        mask = [rng.choice("01") for _ in range(36)]
+        for idx in rng.sample(range(36), floating_bits):
+            mask[idx] = "X"
+        masks.append("".join(mask))
+
+    for idx in range(line_count):
+        if 0 == idx % 8:
+            yield f"mask = {rng.choice(masks)}\n"
+        else:
+            yield f"mem[{rng.randrange(1 << 16)}] = {rng.randrange(1 << 30)}\n"
+
+
+# main
+if __name__ == "__main__":
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.writelines(random_program_lines(line_count))
+    try:
+        start_time = time.perf_counter()
+        program = CompiledProgram.from_file(f.name)
+        compile_time = time.perf_counter() - start_time
+        print(
+            f"{line_count} lines, {len(program.masks)} distinct masks, compiled in {compile_time:.3f}s "
+            f"({line_count / compile_time:.0f} lines/sec)"
+        )
+
+        for version, decoder in decoders.items():
+            start_time = time.perf_counter()
+            line_by_line = decoder()
+            line_by_line.process_instruction_file(f.name)
+            line_by_line_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            compiled = program.replay(decoder())
+            replay_time = time.perf_counter() - start_time
+
+            print(
+                f"version {version}: line by line={line_by_line_time:7.3f}s replay={replay_time:7.3f}s "
+                f"compile+replay={compile_time + replay_time:7.3f}s "
+                f"same sum={line_by_line.memory_sum() == compiled.memory_sum()}"
+            )
+            if line_by_line.memory_sum() != compiled.memory_sum():
+                print(f"Problem here chief..")
+                exit(1)
+    finally:
+        os.remove(f.name)
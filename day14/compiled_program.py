@@ -0,0 +1,109 @@
+#
+#  Compile a docking program once and replay it as often as you like
+#
+#  The whole file is parsed in one pass into three flat arrays,
+#     ops[n]    - OP_MASK or OP_MEM
+#     addrs[n]  - the mem address, or for a mask line which entry of masks it is
+#     values[n] - the value written (0 for a mask line)
+#  Mask strings are only stored once however often they show up, and replay() only makes one
+#  BitMask per distinct mask, so replaying is just a walk down the arrays.
+#
+#  replay() works with the DockingSystem from either part, it builds masks of whatever class
+#  the docking system is already using.
+#
+from array import array
+
+OP_MASK = 0
+OP_MEM = 1
+
+
+class CompiledProgram:
+    def __init__(self):
+        self.ops = bytearray()
+        self.addrs = array("Q")
+        self.values = array("Q")
+        self.masks = []
+        self.mask_numbers = dict()
+
+    def mask_number(self, mask_string: str):
+        """
+        Return where this mask lives in self.masks, adding it the first time we see it
+        """
+        result = self.mask_numbers.get(mask_string)
+        if result is None:
+            result = len(self.masks)
+            self.masks.append(mask_string)
+            self.mask_numbers[mask_string] = result
+        return result
+
+    def add_line(self, this_line: str):
+        """
+        Compile one instruction, either of:
+            mask = XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X
+            mem[8] = 11
+        """
+        target, equals, value = this_line.partition("=")
+        target = target.strip()
+        if "" == equals:
+            raise ValueError(f"Cannot split this instruction correctly: {this_line}")
+        if "mask" == target:
+            self.ops.append(OP_MASK)
+            self.addrs.append(self.mask_number(value.strip()))
+            self.values.append(0)
+        elif target.startswith("mem[") and target.endswith("]"):
+            self.ops.append(OP_MEM)
+            self.addrs.append(int(target[4:-1]))
+            self.values.append(int(value))
+        else:
+            raise ValueError(f"Unknown instruction: {this_line}")
+
+    @classmethod
+    def from_lines(cls, lines):
+        result = cls()
+        for this_line in lines:
+            if not this_line.isspace() and "" != this_line:
+                result.add_line(this_line)
+        return result
+
+    @classmethod
+    def from_file(cls, filename: str):
+        with open(filename, "r") as f:
+            return cls.from_lines(f)
+
+    def __len__(self):
+        return len(self.ops)
+
+    def replay(self, docking_system):
+        """
+        Run the program through a DockingSystem (part 1 or part 2), returns the docking system
+        """
+        mask_class = type(docking_system.mask)
+        bitmasks = [mask_class(mask_string) for mask_string in self.masks]
+        poke = docking_system.poke
+        for op, addr, value in zip(self.ops, self.addrs, self.values):
+            if OP_MEM == op:
+                poke(addr, value)
+            else:
+                docking_system.mask = bitmasks[addr]
+        return docking_system
+
+
+# main, check we get the same as reading the file line by line with both decoders
+if __name__ == "__main__":
+    import day14_part1
+    import day14_part2
+
+    decoders = {1: day14_part1.DockingSystem, 2: day14_part2.DockingSystem}
+    for filename in ("sample2.txt", "input.txt"):
+        program = CompiledProgram.from_file(filename)
+        for version, decoder in decoders.items():
+            line_by_line = decoder()
+            line_by_line.process_instruction_file(filename)
+            compiled = program.replay(decoder())
+            print(
+                f"{filename} version {version}: {len(program)} instructions, {len(program.masks)} masks, "
+                f"line by line={line_by_line.memory_sum()}, compiled={compiled.memory_sum()}"
+            )
+            if line_by_line.memory_sum() != compiled.memory_sum():
+                print(f"Problem here chief..")
+                exit(1)
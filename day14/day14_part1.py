@@ -83,11 +83,12 @@ class BitMask:
 
 
 # some quick testing for the BitMask in case I am an idiot
-m = BitMask("XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X")
-print(str(m))
-for test_value, expected_value in [(11, 73), (101, 101), (0, 64)]:
-    result = m.apply(test_value)
-    print(f"Masked {test_value} and got {result}, expected {expected_value}")
+if __name__ == "__main__":
+    m = BitMask("XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X")
+    print(str(m))
+    for test_value, expected_value in [(11, 73), (101, 101), (0, 64)]:
+        result = m.apply(test_value)
+        print(f"Masked {test_value} and got {result}, expected {expected_value}")
 
 # appears to work for my extensive testing..
 # soo....
@@ -175,7 +176,8 @@ class DockingSystem:
 
 
 # main
-filename = "input.txt"
-docking_system = DockingSystem()
-docking_system.process_instruction_file(filename)
-docking_system.print()
\ No newline at end of file
+if __name__ == "__main__":
+    filename = "input.txt"
+    docking_system = DockingSystem()
+    docking_system.process_instruction_file(filename)
+    docking_system.print()
@@ -90,6 +90,8 @@
 #
 # Execute the initialization program using an emulator for a version 2 decoder chip. What is the sum of all values left in memory after it completes?
 
+from floating_memory import FloatingMemory
+
 
 class BitMask:
     def __init__(self, mask_string):
@@ -116,6 +118,11 @@ class BitMask:
         for idx, this_char in enumerate(reversed(padded_mask_string), start=1):
             if "X" == this_char:
                 self.bit_flip_locations.append(idx)
+        # and the same locations as single bit values and as one mask
+        self.flip_bits = [1 << (flip_idx - 1) for flip_idx in self.bit_flip_locations]
+        self.floating_mask = 0
+        for flip_bit in self.flip_bits:
+            self.floating_mask |= flip_bit
         # ok, we're done..
 
     def generate_addresses(self, i: int, verbose=False) -> int:
@@ -173,6 +180,26 @@ class BitMask:
         # and we're done...,
         return result
 
+    def iterate_addresses(self, i: int):
+        """
+        Yield all the target addresses for a given input address, one at a time in Gray code order
+        so each address is the last one with a single floating bit flipped
+        """
+        address = (i | self.or_mask) & ~self.floating_mask
+        yield address
+        flip_bits = self.flip_bits
+        for n in range(1, 1 << len(flip_bits)):
+            # the bit to flip is the lowest one set in n
+            address ^= flip_bits[(n & -n).bit_length() - 1]
+            yield address
+
+    def address_pattern(self, i: int):
+        """
+        Return (fixed bits, floating bits) describing all the target addresses for a given input address
+        without generating them
+        """
+        return (i | self.or_mask) & ~self.floating_mask, self.floating_mask
+
     def __str__(self):
         """
         produce a nicer representation for this..
@@ -198,20 +225,36 @@ def get_string_between(s, start, end):
     return result
 
 
+# dict -> every floating address gets its own entry
+# floating -> writes are kept as (fixed, floating, value) records, see floating_memory.py
+memory_models = ("dict", "floating")
+
+
 class DockingSystem:
-    def __init__(self):
+    def __init__(self, memory_model="dict"):
+        if memory_model not in memory_models:
+            raise ValueError(
+                f"Unknown memory model {memory_model}, pick from {memory_models}"
+            )
+        self.memory_model = memory_model
         self.mask = BitMask("")
         self.memory = dict()
+        self.floating_memory = FloatingMemory()
 
     def memory_sum(self):
         """
         Return the sum of all the values currently held in memory
         """
+        if "floating" == self.memory_model:
+            return self.floating_memory.memory_sum()
         result = sum(self.memory.values())
         return result
 
     def print(self):
         print(f"Current Mask: {str(self.mask)}")
+        if "floating" == self.memory_model:
+            self.floating_memory.print()
+            return
         print(f"Memory:")
         for this_memory_location in sorted(self.memory.keys()):
             print(f"{this_memory_location:>5} -> {self.memory[this_memory_location]}")
@@ -221,9 +264,12 @@ class DockingSystem:
         """
         apply current mask to value and then store it at the specified address
         """
-        all_target_addresses = self.mask.generate_addresses(address)
-        for this_address in all_target_addresses:
-            self.memory[this_address] = value
+        if "floating" == self.memory_model:
+            self.floating_memory.write(*self.mask.address_pattern(address), value)
+            return
+        memory = self.memory
+        for this_address in self.mask.iterate_addresses(address):
+            memory[this_address] = value
 
     def set_mask(self, new_mask):
         """
@@ -267,7 +313,9 @@ class DockingSystem:
 
 
 # main
-filename = "input.txt"
-docking_system = DockingSystem()
-docking_system.process_instruction_file(filename)
-docking_system.print()
\ No newline at end of file
+if __name__ == "__main__":
+    filename = "input.txt"
+    memory_model = "floating"
+    docking_system = DockingSystem(memory_model)
+    docking_system.process_instruction_file(filename)
+    docking_system.print()
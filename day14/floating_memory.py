@@ -0,0 +1,178 @@
+#
+#  A memory model for the version 2 decoder that never lists the floating addresses
+#
+#  Each write is kept as a record (fixed, floating, value), it covers every address that has the
+#  fixed bits set wherever floating is 0 and anything at all wherever floating is 1, so
+#  2 ^ (number of floating bits) addresses in one go.
+#
+#  A write only keeps the addresses that no later write lands on, so memory_sum takes the overlaps
+#  with the later writes away from each record before adding it in. Inside one
+#  record an overlap is just a few of its floating bits pinned to 0 or 1, and how many addresses
+#  those overlaps cover between them is counted by splitting on one pinned bit at a time.
+#
+import random
+import time
+
+
+def bit_count(i: int) -> int:
+    return bin(i).count("1")
+
+
+def records_overlap(record, other) -> bool:
+    """
+    Two records share an address unless some bit is fixed in both and they disagree on it
+    """
+    fixed, floating, _ = record
+    other_fixed, other_floating, _ = other
+    return 0 == (fixed ^ other_fixed) & ~(floating | other_floating)
+
+
+def overlap_within(record, other):
+    """
+    The addresses of record that other also covers, as (pinned, pinned_values)
+    pinned are the floating bits of record that other has fixed, pinned_values is what they're fixed to
+    """
+    _, floating, _ = record
+    other_fixed, other_floating, _ = other
+    pinned = floating & ~other_floating
+    return pinned, other_fixed & pinned
+
+
+def covered_count(overlaps, free_bits: int) -> int:
+    """
+    overlaps is a list of (pinned, pinned_values), return how many of the 2 ^ free_bits addresses
+    at least one of them covers
+    """
+    if not overlaps:
+        return 0
+    for pinned, _ in overlaps:
+        if 0 == pinned:
+            # this one covers everything
+            return 1 << free_bits
+
+    # split on a bit the first overlap cares about, half the addresses have it 0 and half 1
+    bit = overlaps[0][0] & -overlaps[0][0]
+    with_zero = []
+    with_one = []
+    for pinned, pinned_values in overlaps:
+        if pinned & bit:
+            if pinned_values & bit:
+                with_one.append((pinned ^ bit, pinned_values ^ bit))
+            else:
+                with_zero.append((pinned ^ bit, pinned_values))
+        else:
+            with_zero.append((pinned, pinned_values))
+            with_one.append((pinned, pinned_values))
+    return covered_count(with_zero, free_bits - 1) + covered_count(
+        with_one, free_bits - 1
+    )
+
+
+class FloatingMemory:
+    def __init__(self):
+        self.records = []
+
+    def write(self, fixed: int, floating: int, value: int):
+        """
+        Store value at every address matching fixed with the floating bits set any way at all
+        """
+        self.records.append((fixed & ~floating, floating, value))
+
+    def surviving_counts(self):
+        """
+        Return, for each record, how many of its addresses no later write covers
+        """
+        result = []
+        for idx, record in enumerate(self.records):
+            overlaps = [
+                overlap_within(record, later)
+                for later in self.records[idx + 1 :]
+                if records_overlap(record, later)
+            ]
+            free_bits = bit_count(record[1])
+            result.append((1 << free_bits) - covered_count(overlaps, free_bits))
+        return result
+
+    def memory_sum(self):
+        """
+        Return the sum of all the values currently held in memory
+        """
+        return sum(
+            value * surviving
+            for (_, _, value), surviving in zip(self.records, self.surviving_counts())
+        )
+
+    def address_count(self):
+        """
+        How many different addresses have been written to
+        """
+        return sum(self.surviving_counts())
+
+    def print(self):
+        print(f"Memory ({len(self.records)} writes):")
+        for (fixed, floating, value), surviving in zip(
+            self.records, self.surviving_counts()
+        ):
+            pattern = "".join(
+                "X" if (floating >> bit) & 1 else str((fixed >> bit) & 1)
+                for bit in reversed(range(36))
+            )
+            print(f"{pattern} -> {value} ({surviving} addresses still hold it)")
+        print(f"Sum of memory: {self.memory_sum()}")
+
+
+def random_program(write_count, floating_bits, seed=2020):
+    """
+    Return a list of instruction lines with floating_bits X's in every mask
+    """
+    rng = random.Random(seed)
+    result = []
+    for _ in range(write_count):
+        mask = [rng.choice("01") for _ in range(36)]
+        for idx in rng.sample(range(36), floating_bits):
+            mask[idx] = "X"
+        result.append(f"mask = {''.join(mask)}")
+        for _ in range(rng.randint(1, 4)):
+            result.append(f"mem[{rng.randrange(1 << 16)}] = {rng.randrange(1 << 20)}")
+    return result
+
+
+# main, check we agree with the dict memory and then show off a bit
+if __name__ == "__main__":
+    from day14_part2 import DockingSystem
+
+    for filename in ("sample2.txt", "input.txt"):
+        results = []
+        for memory_model in ("dict", "floating"):
+            docking_system = DockingSystem(memory_model)
+            docking_system.process_instruction_file(filename)
+            results.append(docking_system.memory_sum())
+        print(f"{filename}: dict={results[0]}, floating={results[1]}")
+        if results[0] != results[1]:
+            print(f"Problem here chief..")
+            exit(1)
+
+    for floating_bits in (4, 8):
+        results = []
+        for memory_model in ("dict", "floating"):
+            docking_system = DockingSystem(memory_model)
+            for this_line in random_program(100, floating_bits):
+                docking_system.process_one_instruction_line(this_line)
+            results.append(docking_system.memory_sum())
+        print(f"{floating_bits} floating bits: dict={results[0]}, floating={results[1]}")
+        if results[0] != results[1]:
+            print(f"Problem here chief..")
+            exit(1)
+
+    # far too many addresses to list one at a time
+    for floating_bits in (20, 24):
+        start_time = time.perf_counter()
+        docking_system = DockingSystem("floating")
+        for this_line in random_program(100, floating_bits):
+            docking_system.process_one_instruction_line(this_line)
+        memory_sum = docking_system.memory_sum()
+        print(
+            f"{floating_bits} floating bits: {docking_system.floating_memory.address_count()} addresses "
+            f"from {len(docking_system.floating_memory.records)} writes, sum={memory_sum} "
+            f"in {time.perf_counter() - start_time:.3f}s"
+        )
@@ -0,0 +1,64 @@
+#
+#  Benchmark the day15 engines, turns/sec and peak RSS
+#
+#  Each (engine, turns) run happens in its own child process so the peak RSS we read back
+#  belongs to that run alone and not to whatever ran before it.
+#
+#  usage:
+#     python benchmark.py                      - array & list engines at 30M turns, array at 300M
+#     python benchmark.py array 300000000      - just the one run
+#
+import resource
+import subprocess
+import sys
+import time
+
+from day15_part2 import engines
+
+puzzle_input = (0, 14, 1, 3, 7, 9)
+
+default_runs = [
+    ("array", 30000000),
+    ("list", 30000000),
+    ("array", 300000000),
+]
+
+
+def run_one(engine_name, turns):
+    """
+    Play one game in this process and print a single result line that the parent can parse
+    """
+    engine = engines[engine_name]
+    start_time = time.perf_counter()
+    answer = engine(puzzle_input, iterations=turns, verbose=False)
+    elapsed = time.perf_counter() - start_time
+    # ru_maxrss is in KB on linux
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{engine_name} {turns} {answer} {elapsed} {peak_rss_kb}")
+
+
+def run_in_child(engine_name, turns):
+    """
+    Run one benchmark in a child process and return (answer, seconds, peak_rss_kb)
+    """
+    output = subprocess.run(
+        [sys.executable, __file__, engine_name, str(turns)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    _, _, answer, elapsed, peak_rss_kb = output.split()
+    return int(answer), float(elapsed), int(peak_rss_kb)
+
+
+# main
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        run_one(sys.argv[1], int(sys.argv[2]))
+    else:
+        for engine_name, turns in default_runs:
+            answer, elapsed, peak_rss_kb = run_in_child(engine_name, turns)
+            print(
+                f"engine={engine_name:6} turns={turns:>10} answer={answer:>10} "
+                f"time={elapsed:8.2f}s turns/sec={turns / elapsed:12.0f} peak_rss={peak_rss_kb / 1024:8.1f}MB"
+            )
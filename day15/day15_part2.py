@@ -51,6 +51,7 @@
 
 
 from collections import defaultdict
+from last_seen_engine import play_game_array
 
 
 def play_game(starting_numbers, iterations=2020, verbose=True):
@@ -102,27 +103,38 @@ def play_game(starting_numbers, iterations=2020, verbose=True):
     return this_number
 
 
+# the engines we can play with, "list" is the original dict of turn lists,
+# "array" keeps only the last-seen turn in a preallocated array('I')
+engines = {
+    "list": play_game,
+    "array": play_game_array,
+}
+
+
 # main
-test_cases = [
-    ((0, 3, 6), 436),
-    ((1, 3, 2), 1),
-    ((2, 1, 3), 10),
-    ((1, 2, 3), 27),
-    ((2, 3, 1), 78),
-    ((3, 2, 1), 438),
-    ((3, 1, 2), 1836),
-]
-
-puzzle_input = (0, 14, 1, 3, 7, 9)
-
-for the_input, expected in test_cases:
-    actual = play_game(the_input, iterations=2020, verbose=False)
-    print(f"input: {the_input}, expected={expected}, actual={actual}")
-
-part1_answer = play_game(puzzle_input, iterations=2020, verbose=False)
-print(f"Part 1 answer: {part1_answer}")
-
-# part2, mo' iterations, mo' problems..
-part2_iteration_count = 30000000
-part2_answer = play_game(puzzle_input, iterations=part2_iteration_count, verbose=True)
-print(f"Part 2 answer: {part2_answer}")
\ No newline at end of file
+if __name__ == "__main__":
+    test_cases = [
+        ((0, 3, 6), 436),
+        ((1, 3, 2), 1),
+        ((2, 1, 3), 10),
+        ((1, 2, 3), 27),
+        ((2, 3, 1), 78),
+        ((3, 2, 1), 438),
+        ((3, 1, 2), 1836),
+    ]
+
+    puzzle_input = (0, 14, 1, 3, 7, 9)
+    engine_name = "array"
+    engine = engines[engine_name]
+
+    for the_input, expected in test_cases:
+        actual = engine(the_input, iterations=2020, verbose=False)
+        print(f"input: {the_input}, expected={expected}, actual={actual}")
+
+    part1_answer = engine(puzzle_input, iterations=2020, verbose=False)
+    print(f"Part 1 answer: {part1_answer}")
+
+    # part2, mo' iterations, mo' problems..
+    part2_iteration_count = 30000000
+    part2_answer = engine(puzzle_input, iterations=part2_iteration_count, verbose=True)
+    print(f"Part 2 answer: {part2_answer}")
\ No newline at end of file
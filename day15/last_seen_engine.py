@@ -0,0 +1,74 @@
+#
+#  A compact "last seen" engine for the memory game
+#
+#  Rather than a dict of turn lists we only need to know when a number was last spoken,
+#  so we keep one preallocated array('I') slot per possible number, indexed by the number itself.
+#  0 means "never spoken" which works because turns start at 1.
+#
+#  Every number spoken after the starting list is an age, so it's always smaller than the
+#  turn count, so the buffer never needs to grow once it's allocated.
+#
+from array import array
+
+# how often we print progress when verbose
+progress_interval = 100000
+
+
+def play_game_array(starting_numbers, iterations=2020, verbose=True):
+    """
+    Run n iterations of the game and return the number that will be spoken at that time
+    using a flat array of last-seen turns instead of a dict of lists
+    """
+    buffer_size = max(iterations, max(starting_numbers) + 1)
+    last_seen = array("I", bytes(4 * buffer_size))
+
+    # 1) add the initial list, all but the last one go straight in
+    #    the last one is the "previous number" at the top of the loop
+    for this_turn_number, this_number in enumerate(starting_numbers[:-1], start=1):
+        last_seen[this_number] = this_turn_number
+    this_turn_number = len(starting_numbers)
+    this_number = starting_numbers[-1]
+    if verbose:
+        print(
+            f"this_turn:{this_turn_number}, this_number: {this_number}, buffer_size: {buffer_size}"
+        )
+
+    # 2) loop in chunks so the inner loop doesn't have to think about printing
+    #    at the top of each step this_number was spoken on this_turn_number
+    while this_turn_number < iterations:
+        chunk_end = min(iterations, this_turn_number + progress_interval)
+        for this_turn_number in range(this_turn_number, chunk_end):
+            previous_turn = last_seen[this_number]
+            last_seen[this_number] = this_turn_number
+            if previous_turn:
+                this_number = this_turn_number - previous_turn
+            else:
+                this_number = 0
+        this_turn_number = chunk_end
+
+        if verbose:
+            print(f"this_turn:{this_turn_number}, this_number: {this_number}")
+
+    # and we have finished
+    if verbose:
+        print(f"returning result {this_number}")
+    return this_number
+
+
+# main, some simple testing..
+if __name__ == "__main__":
+    test_cases = [
+        ((0, 3, 6), 436),
+        ((1, 3, 2), 1),
+        ((2, 1, 3), 10),
+        ((1, 2, 3), 27),
+        ((2, 3, 1), 78),
+        ((3, 2, 1), 438),
+        ((3, 1, 2), 1836),
+    ]
+    for the_input, expected in test_cases:
+        actual = play_game_array(the_input, iterations=2020, verbose=False)
+        print(f"input: {the_input}, expected={expected}, actual={actual}")
+        if actual != expected:
+            print(f"Problem here chief..")
+            exit(1)
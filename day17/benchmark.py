@@ -0,0 +1,60 @@
+#
+#  Benchmark SpaceConway stepping modes, cycles/sec against dimensions and generation count
+#
+#  The bounding box mode gets very slow very quickly as dimensions go up so it only runs
+#  for the smaller cases, the sparse and dense modes run everything.
+#
+import time
+
+from day17_part2 import SpaceConway
+
+filename = "input.txt"
+
+# (mode, dimensions, cycles), "sparse_symmetric" is sparse folded about 0 on z, w..
+runs = [
+    ("box", 3, 6),
+    ("sparse", 3, 6),
+    ("sparse_symmetric", 3, 6),
+    ("sparse", 3, 12),
+    ("dense", 3, 6),
+    ("dense", 3, 12),
+    ("box", 4, 6),
+    ("sparse", 4, 6),
+    ("sparse_symmetric", 4, 6),
+    ("sparse", 4, 12),
+    ("sparse_symmetric", 4, 12),
+    ("dense", 4, 6),
+    ("dense", 4, 12),
+    ("sparse", 5, 6),
+    ("sparse_symmetric", 5, 6),
+    ("dense", 5, 6),
+    ("sparse", 6, 6),
+    ("sparse_symmetric", 6, 6),
+    ("dense", 6, 6),
+]
+
+
+def run_one(mode, dimensions, cycles):
+    """
+    return (active cubes at the end, seconds taken)
+    """
+    if "sparse_symmetric" == mode:
+        machine = SpaceConway(dimensions, "sparse", symmetric=True)
+    else:
+        machine = SpaceConway(dimensions, mode)
+    machine.load_initial_state(filename)
+    start_time = time.perf_counter()
+    for _ in range(cycles):
+        machine.step()
+    elapsed = time.perf_counter() - start_time
+    return machine.map.total_active(), elapsed
+
+
+# main
+if __name__ == "__main__":
+    for mode, dimensions, cycles in runs:
+        active, elapsed = run_one(mode, dimensions, cycles)
+        print(
+            f"mode={mode:16} dimensions={dimensions} cycles={cycles:3} active={active:8} "
+            f"time={elapsed:8.3f}s cycles/sec={cycles / elapsed:10.2f}"
+        )
@@ -403,176 +403,262 @@
 
 
 # so Conway in Space!
+from collections import Counter
+from itertools import product
+from operator import add
 
+from space_display import SpaceDisplay
 
-class SpaceMap:
-    def __init__(self):
+
+class SpaceMap(SpaceDisplay):
+    def __init__(self, dimensions=4, folded_axes=()):
+        """
+        folded_axes are mirror-symmetric about 0, only the >= 0 half of them is stored
+        and each stored point stands in for all of its mirror images
+        """
+        self.dimensions = dimensions
+        self.folded_axes = tuple(folded_axes)
         self.clear()
-        self.neighbour_offset_mapping = set()
-        for x in range(-1, 2):
-            for y in range(-1, 2):
-                for z in range(-1, 2):
-                    for w in range(-1, 2):
-                        self.neighbour_offset_mapping.add((x, y, z, w))
+        # every offset in the 3x3x3.. cube around a point
+        self.neighbour_offset_mapping = set(product(range(-1, 2), repeat=dimensions))
         # and remove ourselves..
-        self.neighbour_offset_mapping.remove((0, 0, 0, 0))
-        print(f"nomap is {len(self.neighbour_offset_mapping)}")
+        self.neighbour_offset_mapping.remove((0,) * dimensions)
 
     def clear(self):
-        self.min_x = None
-        self.max_x = None
-        self.min_y = None
-        self.max_y = None
-        self.min_z = None
-        self.max_z = None
-        self.min_w = None
-        self.max_w = None
+        self.min_coords = [None] * self.dimensions
+        self.max_coords = [None] * self.dimensions
         self.state = dict()
 
-    def ensure_boundary_includes(self, x, y, z, w):
+    def ensure_boundary_includes(self, *coords):
         """
         Make sure that min/max values are updated..
         """
-        if self.min_x is None or x < self.min_x:
-            self.min_x = x
-        if self.max_x is None or x > self.max_x:
-            self.max_x = x
-        if self.min_y is None or y < self.min_y:
-            self.min_y = y
-        if self.max_y is None or y > self.max_y:
-            self.max_y = y
-        if self.min_z is None or z < self.min_z:
-            self.min_z = z
-        if self.max_z is None or z > self.max_z:
-            self.max_z = z
-        if self.min_w is None or w < self.min_w:
-            self.min_w = w
-        if self.max_w is None or w > self.max_w:
-            self.max_w = w
-
-    def set_active(self, x, y, z, w):
-        self.state[(x, y, z, w)] = True
-        self.ensure_boundary_includes(x, y, z, w)
-
-    def is_active(self, x, y, z, w):
-        return (x, y, z, w) in self.state
-
-    def count_neighbours(self, x, y, z, w, stop_after=4):
+        for axis, value in enumerate(coords):
+            if self.min_coords[axis] is None or value < self.min_coords[axis]:
+                self.min_coords[axis] = value
+            if self.max_coords[axis] is None or value > self.max_coords[axis]:
+                self.max_coords[axis] = value
+
+    def set_active(self, *coords):
+        self.state[coords] = True
+        self.ensure_boundary_includes(*coords)
+
+    def is_active(self, *coords):
+        return coords in self.state
+
+    def count_neighbours(self, *coords, stop_after=4):
         """
         Return how many neighbours are active within the 1 block cube around the point given
         """
         result = 0
+        state = self.state
 
         # generate all the acceptable offsets.. we should probably only do this once.. so moving this out of here..
-        for x_off, y_off, z_off, w_off in self.neighbour_offset_mapping:
+        for offsets in self.neighbour_offset_mapping:
             # if this one is populated then add one..
-            if self.is_active(x + x_off, y + y_off, z + z_off, w + w_off):
+            if tuple(map(add, coords, offsets)) in state:
                 result += 1
                 if result >= stop_after:
                     break
 
         return result
 
-    def x_range(self):
+    def neighbour_tallies(self):
         """
-        Return the range of values that need to be considered for iterating
+        Return a Counter of point -> number of active neighbours, built by scattering out from
+        each active point, so only points next to something active ever appear in it
         """
-        return range(self.min_x - 1, self.max_x + 2)
+        if self.folded_axes:
+            return self.folded_neighbour_tallies()
 
-    def y_range(self):
+        result = Counter()
+        offsets = self.neighbour_offset_mapping
+        for coords in self.state:
+            result.update(tuple(map(add, coords, these_offsets)) for these_offsets in offsets)
+        return result
+
+    def mirror_images(self, coords):
         """
-        Return the range of values that need to be considered for iterating
+        Return the mirror images of a stored point that can touch the stored half,
+        a folded coordinate of 1 also has an image at -1, 0 and 2+ only need themselves
         """
-        return range(self.min_y - 1, self.max_y + 2)
+        choices = [(value,) for value in coords]
+        for axis in self.folded_axes:
+            if 1 == coords[axis]:
+                choices[axis] = (1, -1)
+        return product(*choices)
 
-    def z_range(self):
+    def folded_neighbour_tallies(self):
         """
-        Return the range of values that need to be considered for iterating
+        neighbour_tallies for a folded map, scatter out from every mirror image of each stored point
+        and only keep the tallies that land in the stored half
         """
-        return range(self.min_z - 1, self.max_z + 2)
+        result = Counter()
+        offsets = self.neighbour_offset_mapping
+        folded_axes = self.folded_axes
+        for coords in self.state:
+            if all(coords[axis] >= 2 for axis in folded_axes):
+                # nowhere near a fold so it's just the normal scatter
+                result.update(tuple(map(add, coords, these_offsets)) for these_offsets in offsets)
+                continue
+            for image in self.mirror_images(coords):
+                for these_offsets in offsets:
+                    neighbour = tuple(map(add, image, these_offsets))
+                    if all(neighbour[axis] >= 0 for axis in folded_axes):
+                        result[neighbour] += 1
+        return result
 
-    def w_range(self):
+    def multiplicity(self, coords):
+        """
+        How many real points a stored point stands for, 2 for every folded axis that isn't 0
+        """
+        return 2 ** sum(1 for axis in self.folded_axes if coords[axis] != 0)
+
+    def axis_range(self, axis):
         """
         Return the range of values that need to be considered for iterating
         """
-        return range(self.min_w - 1, self.max_w + 2)
+        return range(self.min_coords[axis] - 1, self.max_coords[axis] + 2)
+
+    def x_range(self):
+        return self.axis_range(0)
+
+    def y_range(self):
+        return self.axis_range(1)
+
+    def z_range(self):
+        return self.axis_range(2)
 
-    def print(self):
+    def w_range(self):
+        return self.axis_range(3)
+
+    def active_bounds(self):
         """
-        Output each layer
+        Return (min_coords, max_coords), None for both if nothing has been set active
         """
-        for w in range(self.min_w, self.max_w + 1):
-            for z in range(self.min_z, self.max_z + 1):
-                print(f"Layer z={z}, w={w}")
-                # and print the actual layer
-                for y in range(self.min_y, self.max_y + 1):
-                    s = ""
-                    for x in range(self.min_x, self.max_x + 1):
-                        if (x, y, z, w) in self.state:
-                            s += "#"
-                        else:
-                            s += "."
-                    print(f" {s}")
-                print("")
+        return self.min_coords, self.max_coords
 
     def total_active(self):
         """
         Return the number of active cubes in the map
         """
+        if self.folded_axes:
+            return sum(self.multiplicity(coords) for coords in self.state)
         return len(self.state.keys())
 
 
 class SpaceConway:
-    def __init__(self):
+    # "box" checks every point in the bounding box, "sparse" only visits points next to active ones
+    # "dense" keeps the state in a numpy array and counts every neighbour at once
+    step_modes = ("box", "sparse", "dense")
+
+    def __init__(self, dimensions=4, mode="sparse", symmetric=False):
+        """
+        symmetric only simulates the >= 0 half of every axis past x and y, the starting slice
+        sits at 0 on all of them so everything stays a mirror image about 0 (sparse mode only)
+        """
+        if mode not in self.step_modes:
+            raise ValueError(f"Unknown step mode {mode}, expected one of {self.step_modes}")
+        if symmetric and "sparse" != mode:
+            raise ValueError(f"symmetric needs the sparse step mode, not {mode}")
+        self.dimensions = dimensions
+        self.mode = mode
+        self.symmetric = symmetric
         self.clear()
 
+    def new_map(self):
+        """
+        An empty SpaceMap folded over the right axes
+        """
+        folded_axes = ()
+        if self.symmetric:
+            folded_axes = range(2, self.dimensions)
+        return SpaceMap(self.dimensions, folded_axes)
+
     def clear(self):
         self.cycle = 0
-        self.map = SpaceMap()
+        if "dense" == self.mode:
+            # only pull numpy in if we actually want it
+            from dense_space_map import DenseSpaceMap
+
+            self.map = DenseSpaceMap(self.dimensions)
+        else:
+            self.map = self.new_map()
 
     def step(self):
         """
         Move to the next state
         """
-        next_map = SpaceMap()
-        for x in self.map.x_range():
-            for y in self.map.y_range():
-                for z in self.map.z_range():
-                    for w in self.map.w_range():
-                        # run the rules for this new x,y,z
-                        neighbour_count = self.map.count_neighbours(x, y, z, w)
-                        currently_active = self.map.is_active(x, y, z, w)
-                        # If a cube is active and exactly 2 or 3 of its neighbors are also active, the cube remains active. Otherwise, the cube becomes inactive.
-                        # If a cube is inactive but exactly 3 of its neighbors are active, the cube becomes active. Otherwise, the cube remains inactive.
-                        if currently_active:
-                            if neighbour_count in (2, 3):
-                                # anything else will not feature in the next state as active
-                                next_map.set_active(x, y, z, w)
-                        else:
-                            if neighbour_count == 3:
-                                next_map.set_active(x, y, z, w)
+        if "sparse" == self.mode:
+            self.step_sparse()
+        elif "dense" == self.mode:
+            self.step_dense()
+        else:
+            self.step_box()
+
+    def step_box(self):
+        """
+        Move to the next state by checking every point in the bounding box
+        """
+        next_map = SpaceMap(self.dimensions)
+        all_ranges = [self.map.axis_range(axis) for axis in range(self.dimensions)]
+        for coords in product(*all_ranges):
+            # run the rules for this new point
+            neighbour_count = self.map.count_neighbours(*coords)
+            currently_active = self.map.is_active(*coords)
+            # If a cube is active and exactly 2 or 3 of its neighbors are also active, the cube remains active. Otherwise, the cube becomes inactive.
+            # If a cube is inactive but exactly 3 of its neighbors are active, the cube becomes active. Otherwise, the cube remains inactive.
+            if currently_active:
+                if neighbour_count in (2, 3):
+                    # anything else will not feature in the next state as active
+                    next_map.set_active(*coords)
+            else:
+                if neighbour_count == 3:
+                    next_map.set_active(*coords)
+        # and store the result..
+        self.map = next_map
+        self.cycle += 1
+
+    def step_sparse(self):
+        """
+        Move to the next state using neighbour tallies scattered from the active points,
+        anything with no active neighbours can't be active next time so is never looked at
+        """
+        next_map = self.new_map()
+        for coords, neighbour_count in self.map.neighbour_tallies().items():
+            # same rules as step_box
+            if neighbour_count == 3 or (
+                neighbour_count == 2 and coords in self.map.state
+            ):
+                next_map.set_active(*coords)
         # and store the result..
         self.map = next_map
         self.cycle += 1
 
+    def step_dense(self):
+        """
+        Move to the next state with the whole array done in one go
+        """
+        self.map = self.map.next_generation()
+        self.cycle += 1
+
     def print(self, diagram=True):
         """
         Output each layer
         """
         print(
-            f"SpaceConway: {self.map.total_active()} active cubes after {self.cycle} cycles -> x: {self.map.min_x}..{self.map.max_x}, y: {self.map.min_y}..{self.map.max_y}, z:{self.map.min_z}..{self.map.max_z}, w:{self.map.min_w}..{self.map.max_w}"
+            f"SpaceConway: {self.map.total_active()} active cubes after {self.cycle} cycles -> {self.map.describe_bounds()}"
         )
         if diagram:
             self.map.print()
 
     def load_initial_state(self, filename):
         """
-        Read an input file for z=0,
+        Read an input file for z=0, w=0 (and 0 for any other extra dimensions),
         # characters are occupied, other characters are not
         """
+        extra_coords = (0,) * (self.dimensions - 2)
         with open(filename, "r") as f:
-            z = 0
-            w = 0
             y = 0
             for this_line in f:
                 this_line = this_line.strip()
@@ -580,17 +666,35 @@ class SpaceConway:
                     # process this row
                     for x, the_val in enumerate(this_line):
                         if "#" == the_val:
-                            self.map.set_active(x, y, z, w)
+                            self.map.set_active(x, y, *extra_coords)
                     # next row
                     y += 1
 
 
 # main
-filename = "input.txt"
-machine = SpaceConway()
-machine.load_initial_state(filename)
-machine.print()
-for iterations in range(6):
-    machine.step()
-machine.print()
-machine.print(False)
+if __name__ == "__main__":
+    filename = "input.txt"
+    machine = SpaceConway()
+    machine.load_initial_state(filename)
+    machine.print()
+    for iterations in range(6):
+        machine.step()
+    machine.print()
+    machine.print(False)
+
+    # and check the folded version agrees with the full one
+    for filename in ("sample.txt", "input.txt"):
+        for dimensions in (3, 4):
+            results = []
+            for symmetric in (False, True):
+                machine = SpaceConway(dimensions, symmetric=symmetric)
+                machine.load_initial_state(filename)
+                for iterations in range(6):
+                    machine.step()
+                results.append(machine.map.total_active())
+            print(
+                f"{filename} dimensions={dimensions} full={results[0]}, symmetric={results[1]}"
+            )
+            if results[0] != results[1]:
+                print(f"Problem here chief..")
+                exit(1)
@@ -0,0 +1,137 @@
+#
+#  A dense numpy backend for the Conway cubes
+#
+#  The whole state lives in one boolean ndarray, self.origin is the coordinate of cells[0, 0, ..]
+#  Neighbour counts for every cell come from a separable 3-wide box sum along each axis,
+#  take away the cell itself and you have the count of the other 3^n - 1 neighbours.
+#
+#  numpy is only needed if you ask SpaceConway for mode="dense".
+#
+import numpy as np
+
+from space_display import SpaceDisplay
+
+
+class DenseSpaceMap(SpaceDisplay):
+    def __init__(self, dimensions=4):
+        self.dimensions = dimensions
+        self.clear()
+
+    def clear(self):
+        self.cells = np.zeros((1,) * self.dimensions, dtype=bool)
+        self.origin = [0] * self.dimensions
+
+    def ensure_contains(self, *coords):
+        """
+        Grow the array so that the point given is inside it
+        """
+        padding = []
+        for axis, value in enumerate(coords):
+            index = value - self.origin[axis]
+            before = max(0, -index)
+            after = max(0, index - (self.cells.shape[axis] - 1))
+            padding.append((before, after))
+            self.origin[axis] -= before
+        if any(before or after for before, after in padding):
+            self.cells = np.pad(self.cells, padding)
+
+    def ensure_padding(self):
+        """
+        Make sure there's an empty layer on both sides of every axis, anything that can become
+        active next cycle is then inside the array
+        """
+        padding = []
+        for axis in range(self.dimensions):
+            first_layer = np.take(self.cells, 0, axis=axis)
+            last_layer = np.take(self.cells, -1, axis=axis)
+            before = 1 if first_layer.any() else 0
+            after = 1 if last_layer.any() else 0
+            padding.append((before, after))
+            self.origin[axis] -= before
+        if any(before or after for before, after in padding):
+            self.cells = np.pad(self.cells, padding)
+
+    def set_active(self, *coords):
+        self.ensure_contains(*coords)
+        index = tuple(value - offset for value, offset in zip(coords, self.origin))
+        self.cells[index] = True
+
+    def is_active(self, *coords):
+        index = []
+        for axis, value in enumerate(coords):
+            this_index = value - self.origin[axis]
+            if this_index < 0 or this_index >= self.cells.shape[axis]:
+                return False
+            index.append(this_index)
+        return bool(self.cells[tuple(index)])
+
+    def neighbour_counts(self):
+        """
+        Return an array the same shape as cells holding the active neighbour count of every cell
+        """
+        box_sum = self.cells.astype(np.int16)
+        for axis in range(self.dimensions):
+            shifted = box_sum.copy()
+            lower = [slice(None)] * self.dimensions
+            upper = [slice(None)] * self.dimensions
+            lower[axis] = slice(0, -1)
+            upper[axis] = slice(1, None)
+            shifted[tuple(upper)] += box_sum[tuple(lower)]
+            shifted[tuple(lower)] += box_sum[tuple(upper)]
+            box_sum = shifted
+        return box_sum - self.cells
+
+    def next_generation(self):
+        """
+        Return a new DenseSpaceMap one cycle on from this one
+        """
+        self.ensure_padding()
+        neighbour_count = self.neighbour_counts()
+        result = DenseSpaceMap(self.dimensions)
+        result.origin = list(self.origin)
+        # If a cube is active and exactly 2 or 3 of its neighbors are also active, the cube remains active.
+        # If a cube is inactive but exactly 3 of its neighbors are active, the cube becomes active.
+        result.cells = (neighbour_count == 3) | (self.cells & (neighbour_count == 2))
+        return result
+
+    def active_bounds(self):
+        """
+        Return (min_coords, max_coords) of the active cells, or None for both if there aren't any
+        """
+        active_indexes = np.nonzero(self.cells)
+        if 0 == len(active_indexes[0]):
+            return [None] * self.dimensions, [None] * self.dimensions
+        min_coords = [
+            int(indexes.min()) + offset
+            for indexes, offset in zip(active_indexes, self.origin)
+        ]
+        max_coords = [
+            int(indexes.max()) + offset
+            for indexes, offset in zip(active_indexes, self.origin)
+        ]
+        return min_coords, max_coords
+
+    def total_active(self):
+        """
+        Return the number of active cubes in the map
+        """
+        return int(np.count_nonzero(self.cells))
+
+
+# main, check we agree with the dict backend
+if __name__ == "__main__":
+    from day17_part2 import SpaceConway
+
+    for filename in ("sample.txt", "input.txt"):
+        for dimensions in (3, 4):
+            results = []
+            for mode in ("sparse", "dense"):
+                machine = SpaceConway(dimensions, mode)
+                machine.load_initial_state(filename)
+                for _ in range(6):
+                    machine.step()
+                results.append(machine.map.total_active())
+            print(f"{filename} dimensions={dimensions} sparse={results[0]}, dense={results[1]}")
+            if results[0] != results[1]:
+                print(f"Problem here chief..")
+                exit(1)
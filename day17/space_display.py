@@ -0,0 +1,56 @@
+#
+#  Printing for the space maps
+#
+#  Both SpaceMap and DenseSpaceMap mix this in, all it needs from them is self.dimensions,
+#  active_bounds() giving (min_coords, max_coords) and is_active(*coords).
+#
+from itertools import product
+
+
+class SpaceDisplay:
+    def axis_name(self, axis):
+        """
+        x, y, z, w and then d4, d5.. once we run out of letters
+        """
+        axis_names = "xyzw"
+        if axis < len(axis_names):
+            return axis_names[axis]
+        return f"d{axis}"
+
+    def describe_bounds(self):
+        """
+        x: -1..1, y: 0..3, z:.. for printing
+        """
+        min_coords, max_coords = self.active_bounds()
+        parts = []
+        for axis in range(self.dimensions):
+            parts.append(f"{self.axis_name(axis)}: {min_coords[axis]}..{max_coords[axis]}")
+        return ", ".join(parts)
+
+    def print(self):
+        """
+        Output each layer
+        """
+        min_coords, max_coords = self.active_bounds()
+        if min_coords[0] is None:
+            return
+        layer_ranges = [
+            range(min_coords[axis], max_coords[axis] + 1)
+            for axis in range(2, self.dimensions)
+        ]
+        for layer in product(*layer_ranges):
+            layer_name = ", ".join(
+                f"{self.axis_name(axis)}={value}"
+                for axis, value in enumerate(layer, start=2)
+            )
+            print(f"Layer {layer_name}")
+            # and print the actual layer
+            for y in range(min_coords[1], max_coords[1] + 1):
+                s = ""
+                for x in range(min_coords[0], max_coords[0] + 1):
+                    if self.is_active(x, y, *layer):
+                        s += "#"
+                    else:
+                        s += "."
+                print(f" {s}")
+            print("")
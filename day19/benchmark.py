@@ -0,0 +1,87 @@
+#
+#  Benchmark the part 2 matchers, the list-of-remainders tree walker against the chart matcher
+#  (the walker's count of evaluations skipped by the length / first character checks is shown too)
+#
+#  The long messages are made by expanding rule 0 of input_part2.txt at random, going round the
+#  8 and 11 loops a set number of times, half of them then get a character flipped so there's
+#  a mix of matches and non-matches.
+#
+import random
+import time
+
+from day19_part2 import ListNode, load_puzzle
+
+filename = "input_part2.txt"
+
+# (loops round rules 8 and 11, how many messages)
+generated_sizes = [(2, 200), (5, 100), (10, 50), (20, 20)]
+
+
+def generate_message(m, rule_no, rng, loops):
+    """
+    expand a rule at random, rules that refer to themselves take the looping choice
+    until they've been round `loops` times
+    """
+    the_rule = m.rules[rule_no]
+    if not isinstance(the_rule, ListNode):
+        return the_rule.literal
+
+    looping = [ruleset for ruleset in the_rule.rulesets if rule_no in ruleset]
+    if looping:
+        if loops > 0:
+            ruleset = looping[0]
+        else:
+            ruleset = [ruleset for ruleset in the_rule.rulesets if rule_no not in ruleset][0]
+    else:
+        ruleset = rng.choice(the_rule.rulesets)
+
+    return "".join(
+        generate_message(m, this_rule_no, rng, loops - 1 if this_rule_no == rule_no else loops)
+        for this_rule_no in ruleset
+    )
+
+
+def generate_messages(m, loops, count, seed=2020):
+    rng = random.Random(seed)
+    result = []
+    for idx in range(count):
+        message = generate_message(m, 0, rng, rng.randint(0, loops))
+        if idx % 2:
+            # flip one character so it (probably) doesn't match any more
+            flip_at = rng.randrange(len(message))
+            flipped = "a" if message[flip_at] == "b" else "b"
+            message = message[:flip_at] + flipped + message[flip_at + 1 :]
+        result.append(message)
+    return result
+
+
+def time_matcher(evaluate_rule, messages):
+    start_time = time.perf_counter()
+    match_count = sum(1 for message in messages if evaluate_rule(0, message))
+    return match_count, time.perf_counter() - start_time
+
+
+def compare(description, m, messages):
+    skipped_before = m.skipped_evaluations()
+    walker_matches, walker_time = time_matcher(m.evaluate_rule, messages)
+    walker_skipped = m.skipped_evaluations() - skipped_before
+    chart_matches, chart_time = time_matcher(m.evaluate_rule_chart, messages)
+    longest = max(len(message) for message in messages)
+    print(
+        f"{description:32} longest={longest:5} matches={walker_matches}/{chart_matches} "
+        f"walker={walker_time:8.3f}s chart={chart_time:8.3f}s messages/sec walker={len(messages) / walker_time:9.0f} "
+        f"chart={len(messages) / chart_time:9.0f} walker skipped={walker_skipped}"
+    )
+    if walker_matches != chart_matches:
+        print(f"Problem here chief..")
+        exit(1)
+
+
+# main
+if __name__ == "__main__":
+    m, messages = load_puzzle(filename)
+    compare(filename, m, messages)
+
+    for loops, count in generated_sizes:
+        generated = generate_messages(m, loops, count)
+        compare(f"{count} messages, up to {loops} loops", m, generated)
@@ -72,12 +72,23 @@
 #  and somehow deal with returning multiple tuples of (True, "xyz"), (True, "z").. a cursory look at the rules suggests that this isn't the case, so going to add a check
 #  at load time.
 #
+import re
 from typing import Tuple
 
 
+class RecursiveRuleError(Exception):
+    """
+    raised while compiling when a rule ends up referring back to itself
+    """
+
+    pass
+
+
 class MonsterMessages:
     def __init__(self):
         self.rules = dict()
+        # rule_no -> compiled regex for that rule, or None if the rule is recursive and can't be compiled
+        self.compiled_rules = dict()
 
     def add_rule(self, the_rule: str):
         """
@@ -103,11 +114,69 @@ class MonsterMessages:
 
         # and store the rule..
         self.rules[rule_no] = actual_rule
+        # anything compiled so far might have used the old version of this rule
+        self.compiled_rules.clear()
+
+    def rule_pattern(self, rule_no: int, in_progress: set, patterns: dict) -> str:
+        """
+        Return a regex pattern (without anchors) for the rule, patterns caches the ones already built
+        and in_progress holds the rules we're part way through so a loop can be spotted
+        """
+        if rule_no in patterns:
+            return patterns[rule_no]
+        if rule_no in in_progress:
+            raise RecursiveRuleError(f"rule #{rule_no} refers back to itself")
+
+        the_rule = self.rules[rule_no]
+        if isinstance(the_rule, LiteralNode):
+            result = re.escape(the_rule.literal)
+        else:
+            in_progress.add(rule_no)
+            alternatives = [
+                "".join(
+                    self.rule_pattern(this_rule_no, in_progress, patterns)
+                    for this_rule_no in this_ruleset
+                )
+                for this_ruleset in the_rule.rulesets
+            ]
+            in_progress.remove(rule_no)
+            result = f"(?:{'|'.join(alternatives)})"
+
+        patterns[rule_no] = result
+        return result
+
+    def compiled_rule(self, rule_no: int):
+        """
+        Return the compiled regex for a rule, building it the first time it's asked for,
+        or None if the rule is recursive (not a regular grammar any more)
+        """
+        if rule_no not in self.compiled_rules:
+            try:
+                pattern = self.rule_pattern(rule_no, set(), dict())
+                self.compiled_rules[rule_no] = re.compile(pattern)
+            except RecursiveRuleError:
+                self.compiled_rules[rule_no] = None
+        return self.compiled_rules[rule_no]
+
+    def count_matches(self, rule_no: int, messages) -> int:
+        """
+        How many of the messages completely match the specified rule ?
+        """
+        compiled = self.compiled_rule(rule_no)
+        if compiled is None:
+            return sum(1 for message in messages if self.evaluate_rule(rule_no, message))
+        fullmatch = compiled.fullmatch
+        return sum(1 for message in messages if fullmatch(message) is not None)
 
     def evaluate_rule(self, rule_no: int, value_to_check: str) -> bool:
         """
         Does the value passed completely match the specified rule ?
+        uses the compiled regex when the rule has one, otherwise walks the rule tree
         """
+        compiled = self.compiled_rule(rule_no)
+        if compiled is not None:
+            return compiled.fullmatch(value_to_check) is not None
+
         result = False
 
         result, remaining = self.rules[rule_no].evaluate(value_to_check)
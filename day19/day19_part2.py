@@ -161,12 +161,14 @@
 #  actually, this seems like it should be super easy (14:04)
 #
 
+import math
 from typing import Tuple, List
 
 
 class MonsterMessages:
     def __init__(self):
         self.rules = dict()
+        self.analysed = False
 
     def add_rule(self, the_rule: str):
         """
@@ -192,14 +194,103 @@ class MonsterMessages:
 
         # and store the rule..
         self.rules[rule_no] = actual_rule
+        # the length bounds need working out again
+        self.analysed = False
+
+    def analyse_rules(self):
+        """
+        Work out for every rule
+          - min_length: the shortest string it can match
+          - max_length: the longest, math.inf if it can loop
+          - first_chars: the set of characters a match can start with
+        and store them on the nodes so ListNode.evaluate can skip anything that can't possibly match.
+        min_length and first_chars are built up by going round all the rules until nothing changes,
+        max_length is inf for anything that can reach a loop.
+        """
+        for the_rule in self.rules.values():
+            the_rule.min_length = math.inf
+            the_rule.max_length = math.inf
+            the_rule.first_chars = set()
+
+        something_changed = True
+        while something_changed:
+            something_changed = False
+            for the_rule in self.rules.values():
+                if isinstance(the_rule, LiteralNode):
+                    min_length = len(the_rule.literal)
+                    first_chars = {the_rule.literal[:1]}
+                else:
+                    min_length = min(
+                        sum(self.rules[this_rule_no].min_length for this_rule_no in this_ruleset)
+                        for this_ruleset in the_rule.rulesets
+                    )
+                    first_chars = set()
+                    for this_ruleset in the_rule.rulesets:
+                        first_chars.update(self.rules[this_ruleset[0]].first_chars)
+                if min_length != the_rule.min_length or first_chars != the_rule.first_chars:
+                    the_rule.min_length = min_length
+                    the_rule.first_chars = first_chars
+                    something_changed = True
+
+        # max lengths, a rule we meet again while we're still working it out is a loop
+        in_progress = set()
+        known_max_lengths = dict()
+
+        def max_length(rule_no):
+            if rule_no in in_progress:
+                return math.inf
+            if rule_no in known_max_lengths:
+                return known_max_lengths[rule_no]
+            the_rule = self.rules[rule_no]
+            if isinstance(the_rule, LiteralNode):
+                result = len(the_rule.literal)
+            else:
+                in_progress.add(rule_no)
+                result = max(
+                    sum(max_length(this_rule_no) for this_rule_no in this_ruleset)
+                    for this_ruleset in the_rule.rulesets
+                )
+                in_progress.remove(rule_no)
+            known_max_lengths[rule_no] = result
+            return result
+
+        for rule_no, the_rule in self.rules.items():
+            the_rule.max_length = max_length(rule_no)
+
+        # and how much is still needed from each step of each ruleset onwards
+        for the_rule in self.rules.values():
+            if isinstance(the_rule, ListNode):
+                the_rule.remaining_min_lengths = []
+                for this_ruleset in the_rule.rulesets:
+                    min_lengths = [self.rules[this_rule_no].min_length for this_rule_no in this_ruleset]
+                    the_rule.remaining_min_lengths.append(
+                        [sum(min_lengths[idx:]) for idx in range(len(min_lengths))]
+                    )
+
+        self.analysed = True
+
+    def skipped_evaluations(self) -> int:
+        """
+        How many sub-rule evaluations have been skipped by the length / first character checks
+        """
+        return sum(the_rule.skipped_evaluations for the_rule in self.rules.values())
 
     def evaluate_rule(self, rule_no: int, value_to_check: str) -> bool:
         """
         Does the value passed completely match the specified rule ?
         """
+        if not self.analysed:
+            self.analyse_rules()
+
         result = False
 
-        result, remaining = self.rules[rule_no].evaluate(value_to_check)
+        # no point starting if the length's wrong
+        the_rule = self.rules[rule_no]
+        if not (the_rule.min_length <= len(value_to_check) <= the_rule.max_length):
+            the_rule.skipped_evaluations += 1
+            return result
+
+        result, remaining = the_rule.evaluate(value_to_check)
 
         if result and "" not in remaining:
             # print(                f"rule {rule_no} matched fine, but left us with [{remaining}] so it's a no from me I'm afraid.."            )
@@ -207,6 +298,84 @@ class MonsterMessages:
 
         return result
 
+    def evaluate_rule_chart(self, rule_no: int, value_to_check: str) -> bool:
+        """
+        Does the value passed completely match the specified rule ? using the ChartMatcher
+        """
+        return ChartMatcher(self.rules, value_to_check).matches(rule_no)
+
+
+class ChartMatcher:
+    """
+    Matches rules against one message by position rather than by slicing strings,
+    the chart maps (rule_no, start_pos) -> frozenset of the positions that rule can end at.
+    Each (rule_no, start_pos) is only worked out once so the cost is polynomial in the message length.
+
+    A rule that gets back to itself without consuming anything (left recursion) uses whatever the
+    chart holds so far for that entry, and then the whole thing is re-run until nothing grows.
+    """
+
+    def __init__(self, rulebook: dict, message: str):
+        self.rulebook = rulebook
+        self.message = message
+        self.chart = dict()
+        self.in_progress = set()
+        self.chart_grew = False
+        self.hit_cycle = False
+
+    def matches(self, rule_no: int) -> bool:
+        """
+        True if the rule can consume the whole message
+        """
+        while True:
+            self.chart_grew = False
+            self.hit_cycle = False
+            self.finished = set()
+            end_positions = self.rule_ends(rule_no, 0)
+            # only a cycle can leave the chart short, so no cycle or no growth means we're done
+            if not (self.hit_cycle and self.chart_grew):
+                break
+        return len(self.message) in end_positions
+
+    def rule_ends(self, rule_no: int, start_pos: int) -> frozenset:
+        """
+        Return the positions that rule_no can finish at if it starts at start_pos
+        """
+        key = (rule_no, start_pos)
+        if key in self.finished:
+            return self.chart[key]
+        if key in self.in_progress:
+            self.hit_cycle = True
+            return self.chart.get(key, frozenset())
+
+        the_rule = self.rulebook[rule_no]
+        if isinstance(the_rule, LiteralNode):
+            if self.message.startswith(the_rule.literal, start_pos):
+                result = frozenset([start_pos + len(the_rule.literal)])
+            else:
+                result = frozenset()
+        else:
+            self.in_progress.add(key)
+            all_ends = set()
+            for this_ruleset in the_rule.rulesets:
+                positions = {start_pos}
+                for this_rule_no in this_ruleset:
+                    next_positions = set()
+                    for this_pos in positions:
+                        next_positions.update(self.rule_ends(this_rule_no, this_pos))
+                    positions = next_positions
+                    if not positions:
+                        break
+                all_ends.update(positions)
+            self.in_progress.remove(key)
+            result = frozenset(all_ends)
+
+        if result != self.chart.get(key):
+            self.chart_grew = True
+            self.chart[key] = result
+        self.finished.add(key)
+        return result
+
 
 def depth_print(depth, s):
     """
@@ -225,6 +394,11 @@ class LiteralNode:
     def __init__(self, rule_no: int, the_literal: str):
         self.literal = the_literal
         self.rule_no = rule_no
+        # filled in by MonsterMessages.analyse_rules
+        self.min_length = 0
+        self.max_length = math.inf
+        self.first_chars = None
+        self.skipped_evaluations = 0
 
     def __repr__(self):
         return f"#{self.ruleno}: literal={self.literal}"
@@ -255,6 +429,12 @@ class ListNode:
         self.rulesets = []
         self.rule_no = rule_no
         self.rulebook = rulebook
+        # filled in by MonsterMessages.analyse_rules
+        self.min_length = 0
+        self.max_length = math.inf
+        self.first_chars = None
+        self.remaining_min_lengths = None
+        self.skipped_evaluations = 0
 
         lists_of_rules = list_of_lists_of_rules.split("|")
         for this_list_of_rules in lists_of_rules:
@@ -275,11 +455,12 @@ class ListNode:
         depth_print(depth, f"{self}")
 
         # try each of our rules in turn, keeping all the winners..
-        for this_rule in self.rulesets:
+        for ruleset_idx, this_rule in enumerate(self.rulesets):
             # run this rule based on our single starting value..
             valid_at_start_of_step = [the_value]
+            valid_after_step = list()
 
-            for this_rule_no in this_rule:
+            for step_idx, this_rule_no in enumerate(this_rule):
                 # this is a step in the process
                 # this step should be evaluated for every input in valid_at_start_of_step
                 # if needs to generate a list for valid_after_step which will become the input to the next round or this final result if this is the last round
@@ -288,13 +469,25 @@ class ListNode:
                     f"{self.rule_no}: running sub_rule #{this_rule_no} against {valid_at_start_of_step}",
                 )
                 valid_after_step = list()
+                sub_rule = self.rulebook[this_rule_no]
+                if self.remaining_min_lengths is None:
+                    still_needed = 0
+                else:
+                    still_needed = self.remaining_min_lengths[ruleset_idx][step_idx]
                 for this_input_value in valid_at_start_of_step:
+                    # skip anything too short for the rest of this ruleset, or that starts with the wrong character
+                    if len(this_input_value) < still_needed or (
+                        sub_rule.first_chars is not None
+                        and this_input_value[:1] not in sub_rule.first_chars
+                    ):
+                        sub_rule.skipped_evaluations += 1
+                        continue
                     depth_print(
                         depth,
                         f"{self.rule_no}: executing rule #{this_rule_no} with input {this_input_value}",
                     )
                     # running this rule step for this particular input
-                    result, valid_outputs = self.rulebook[this_rule_no].evaluate(
+                    result, valid_outputs = sub_rule.evaluate(
                         this_input_value, depth=depth + 1
                     )
                     if result:
@@ -333,27 +526,45 @@ if False:
 
     exit(42)
 
-# and the real-deal
-filename = "input_part2.txt"
-# filename = "sample3.txt"
-m = MonsterMessages()
-match_count = 0
-
-with open(filename, "r") as f:
-    in_rules_section = True
-    for this_line in f:
-        this_line = this_line.strip()
-        if "" == this_line:
-            in_rules_section = False
-        else:
-            # either this is a rule..
-            if in_rules_section:
-                m.add_rule(this_line)
+
+def load_puzzle(filename):
+    """
+    Return a MonsterMessages with the rules from the file and the list of messages
+    """
+    m = MonsterMessages()
+    messages = []
+    with open(filename, "r") as f:
+        in_rules_section = True
+        for this_line in f:
+            this_line = this_line.strip()
+            if "" == this_line:
+                in_rules_section = False
             else:
-                if not this_line.startswith("#"):
-                    # we need to evaluate the rule 0 against this string..
-                    matching = m.evaluate_rule(0, this_line)
-                    print(f"{matching} -> {this_line}")
-                    if matching:
-                        match_count += 1
-print(f"total matches: {match_count}")
+                # either this is a rule..
+                if in_rules_section:
+                    m.add_rule(this_line)
+                else:
+                    if not this_line.startswith("#"):
+                        messages.append(this_line)
+    return m, messages
+
+
+# and the real-deal
+if __name__ == "__main__":
+    filename = "input_part2.txt"
+    # filename = "sample3.txt"
+    # the chart matcher works on positions and remembers every (rule, position) it has tried
+    use_chart = True
+    m, messages = load_puzzle(filename)
+    evaluate_rule = m.evaluate_rule_chart if use_chart else m.evaluate_rule
+    match_count = 0
+
+    for this_line in messages:
+        # we need to evaluate the rule 0 against this string..
+        matching = evaluate_rule(0, this_line)
+        print(f"{matching} -> {this_line}")
+        if matching:
+            match_count += 1
+    print(f"total matches: {match_count}")
+    if not use_chart:
+        print(f"skipped evaluations: {m.skipped_evaluations()}")
@@ -0,0 +1,176 @@
+#
+#  Benchmark the TileBoard solver on big made-up puzzles
+#
+#  Each puzzle is cut out of one random picture, neighbouring tiles share their border row / column
+#  just like the real thing. Any border that would have the same signature as another one is re-rolled
+#  (keeping the corner pixels, they belong to the other borders too) so every tile only fits one way.
+#  The tiles are then given random numbers, rotated / flipped at random, shuffled and written to a
+#  temporary file so they go through load_tiles_from_file like the puzzle input does.
+#
+#  solve() copies the board and recurses once per tile placed (so the recursion limit has to go up
+#  for the big ones), solve_in_place() works on one board with an undo log, with and without starting
+#  from the corners the edge frequencies give. Each gets timed, then run again under tracemalloc for
+#  the peak memory. The corners-only part 1 answer is timed too.
+#
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from day20_part2 import TileBoard, load_tiles_from_file
+
+# (tiles along each side, pixels along each side of a tile)
+puzzle_sizes = [(12, 10), (20, 20), (50, 20)]
+
+
+def border_cells(tiles_per_side, tile_size):
+    """
+    Return the list of cells [(x, y), ..] making up each tile border, horizontal and vertical
+    """
+    step = tile_size - 1
+    result = []
+    for i in range(tiles_per_side + 1):
+        for j in range(tiles_per_side):
+            result.append([(j * step + k, i * step) for k in range(tile_size)])
+            result.append([(i * step, j * step + k) for k in range(tile_size)])
+    return result
+
+
+def make_picture(tiles_per_side, tile_size, rng):
+    """
+    Return a random picture (list of lists of bool) where every tile border is unique
+    """
+    picture_size = tiles_per_side * (tile_size - 1) + 1
+    picture = [
+        [rng.random() < 0.5 for x in range(picture_size)] for y in range(picture_size)
+    ]
+
+    seen = set()
+    for cells in border_cells(tiles_per_side, tile_size):
+        while True:
+            bits = tuple(picture[y][x] for x, y in cells)
+            signature = min(bits, bits[::-1])
+            if signature not in seen:
+                break
+            # re-roll everything but the corners
+            for x, y in cells[1:-1]:
+                picture[y][x] = rng.random() < 0.5
+        seen.add(signature)
+
+    return picture
+
+
+def transform(rows, rng):
+    """
+    rotate the rows of a tile a random number of times and maybe flip it
+    """
+    for _ in range(rng.randrange(4)):
+        rows = ["".join(column) for column in zip(*rows[::-1])]
+    if rng.random() < 0.5:
+        rows = [row[::-1] for row in rows]
+    return rows
+
+
+def make_puzzle(tiles_per_side, tile_size, seed=2020):
+    """
+    Return (puzzle text, the product of the corner tile numbers)
+    """
+    rng = random.Random(seed)
+    picture = make_picture(tiles_per_side, tile_size, rng)
+    step = tile_size - 1
+    tile_numbers = rng.sample(range(1000, 1000000), tiles_per_side * tiles_per_side)
+
+    tiles = []
+    corner_product = 1
+    for tile_y in range(tiles_per_side):
+        for tile_x in range(tiles_per_side):
+            tile_no = tile_numbers[tile_y * tiles_per_side + tile_x]
+            if tile_x in (0, tiles_per_side - 1) and tile_y in (0, tiles_per_side - 1):
+                corner_product *= tile_no
+            rows = [
+                "".join(
+                    "#" if picture[tile_y * step + y][tile_x * step + x] else "."
+                    for x in range(tile_size)
+                )
+                for y in range(tile_size)
+            ]
+            tiles.append(f"Tile {tile_no}:\n" + "\n".join(transform(rows, rng)) + "\n")
+
+    rng.shuffle(tiles)
+    return "\n".join(tiles), corner_product
+
+
+def corner_product(board):
+    result = 1
+    for x in (board.min_x, board.max_x):
+        for y in (board.min_y, board.max_y):
+            result *= board.get_tile(x, y).tile_no()
+    return result
+
+
+# how each solver gets run on a fresh board
+solvers = {
+    "solve": lambda board: board.solve(),
+    "in_place": lambda board: board.solve_in_place(seed_corners=False),
+    "in_place_seeded": lambda board: board.solve_in_place(),
+}
+
+
+def time_solver(tilebag, solver):
+    board = TileBoard(tilebag, verbose=False)
+    start_time = time.perf_counter()
+    solved = solvers[solver](board)
+    return solved, time.perf_counter() - start_time
+
+
+def peak_memory(tilebag, solver):
+    board = TileBoard(tilebag, verbose=False)
+    tracemalloc.start()
+    solvers[solver](board)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+# main
+if __name__ == "__main__":
+    sys.setrecursionlimit(10000)
+
+    for tiles_per_side, tile_size in puzzle_sizes:
+        text, expected = make_puzzle(tiles_per_side, tile_size)
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+            f.write(text)
+        try:
+            start_time = time.perf_counter()
+            tilebag = load_tiles_from_file(f.name, verbose=False)
+            load_time = time.perf_counter() - start_time
+        finally:
+            os.remove(f.name)
+
+        print(
+            f"{tiles_per_side}x{tiles_per_side} tiles of {tile_size}x{tile_size}: "
+            f"signatures={len(tilebag.edge_index.index):6} load+index={load_time:7.3f}s"
+        )
+        start_time = time.perf_counter()
+        corner_answer = tilebag.answer_part1_from_corners(verbose=False)
+        corner_time = time.perf_counter() - start_time
+        print(f"    {'corners only':15} time={corner_time:7.3f}s")
+        if corner_answer != expected:
+            print(f"Problem here chief..")
+            exit(1)
+
+        for solver in solvers:
+            solved, solve_time = time_solver(tilebag, solver)
+            if solved is None or corner_product(solved) != expected:
+                print(f"Problem here chief..")
+                exit(1)
+            peak = peak_memory(tilebag, solver)
+            search = ""
+            if hasattr(solved, "nodes_visited"):
+                search = f" nodes visited={solved.nodes_visited} backtracks={solved.backtracks}"
+            print(
+                f"    {solver:15} time={solve_time:7.3f}s "
+                f"peak memory={peak / 1024 / 1024:8.2f}MB{search}"
+            )
@@ -313,6 +313,7 @@
 
 
 import math
+from collections import Counter
 
 
 TOP = 0
@@ -337,18 +338,35 @@ def offsets_for_direction(direction):
 
 
 class Tile:
+    """
+    The image is held as one int per row, the leftmost pixel is the top bit so a row reads
+    the same way it prints. All 8 orientations (and their edges) get worked out the first time
+    anyone asks and are kept until the image changes.
+    """
+
     def __init__(self, tile_no: int, tile_size=10):
         self.tile_no = tile_no
-        self.raw_image = dict()
+        self.rows = [0] * tile_size
         self.tile_size = tile_size
         # we use this all over the place
         self.tile_max = tile_size - 1
+        # (rotation, x_flipped, y_flipped) -> (rows, (top, right, bottom, left) edge scores)
+        self.orientations = None
+
+    @classmethod
+    def from_rows(cls, tile_no: int, rows, tile_size: int):
+        """
+        Create a tile straight from a list of row ints
+        """
+        t = cls(tile_no, tile_size=tile_size)
+        t.rows = list(rows)
+        return t
 
     def total_tiles(self):
         """
         Return how many locations are populated
         """
-        return len(self.raw_image)
+        return sum(bin(row).count("1") for row in self.rows)
 
     def picture_dimension(self):
         """
@@ -356,89 +374,62 @@ class Tile:
         """
         return self.tile_size - 2
 
-    def _get_side_score(
-        self, edge: int, rotation: int, x_flipped: bool, y_flipped: bool, reverse: bool
-    ):
+    def build_orientations(self):
         """
-        Produce the score provided by the edge specified (TOP, RIGHT, BOTTOM, LEFT)
+        Work out the rows and edge scores for every rotation / flip combination
+        the rotation is applied to the image first and the flips are applied to the rotated image
+        (that's the same as flipping the read location and then rotating it, which is how this used to work)
         """
-        if TOP == edge:
-            result = self._calculate_one_side(
-                0, self.tile_max, 0, 0, x_flipped, y_flipped, rotation, reverse
-            )
-        elif RIGHT == edge:
-            result = self._calculate_one_side(
-                self.tile_max,
-                self.tile_max,
-                0,
-                self.tile_max,
-                x_flipped,
-                y_flipped,
-                rotation,
-                reverse,
-            )
-        elif BOTTOM == edge:
-            result = self._calculate_one_side(
-                self.tile_max,
-                0,
-                self.tile_max,
-                self.tile_max,
-                x_flipped,
-                y_flipped,
-                rotation,
-                reverse,
-            )
-        elif LEFT == edge:
-            result = self._calculate_one_side(
-                0, 0, self.tile_max, 0, x_flipped, y_flipped, rotation, reverse
-            )
+        self.orientations = dict()
+        rotated = [format(row, f"0{self.tile_size}b") for row in self.rows]
+        for rotation in [0, 90, 180, 270]:
+            for x_flipped in [False, True]:
+                lines = [line[::-1] for line in rotated] if x_flipped else rotated
+                # edges read clockwise round the tile, the first pixel read is the top bit
+                top = lines[0]
+                right = "".join(line[-1] for line in lines)
+                bottom = lines[-1][::-1]
+                left = "".join(line[0] for line in lines[::-1])
+                self.orientations[(rotation, x_flipped, False)] = (
+                    [int(line, 2) for line in lines],
+                    tuple(int(edge, 2) for edge in (top, right, bottom, left)),
+                )
+            # 90 degrees clockwise, so what was the left column (read bottom up) becomes the top row
+            rotated = ["".join(column) for column in zip(*rotated[::-1])]
 
-        return result
+        # a y flip is the same as turning another 180 and doing the x flip the other way
+        for rotation, x_flipped, _ in distinct_tile_configurations():
+            self.orientations[(rotation, x_flipped, True)] = self.orientations[
+                ((rotation + 180) % 360, not x_flipped, False)
+            ]
+
+    def oriented_rows(self, rotation: int, x_flipped: bool, y_flipped: bool):
+        """
+        Return the list of row ints as they look after the rotation and flip
+        """
+        if self.orientations is None:
+            self.build_orientations()
+        return self.orientations[(rotation, x_flipped, y_flipped)][0]
 
     def get_side_score(
         self, edge: int, rotation: int, x_flipped: bool, y_flipped: bool
     ):
-        return self._get_side_score(edge, rotation, x_flipped, y_flipped, False)
+        """
+        Produce the score provided by the edge specified (TOP, RIGHT, BOTTOM, LEFT)
+        """
+        if self.orientations is None:
+            self.build_orientations()
+        return self.orientations[(rotation, x_flipped, y_flipped)][1][edge]
 
     def get_side_accepts(
         self, edge: int, rotation: int, x_flipped: bool, y_flipped: bool
-    ):
-        return self._get_side_score(edge, rotation, x_flipped, y_flipped, True)
-
-    def _calculate_one_side(
-        self,
-        start_x: int,
-        end_x: int,
-        start_y: int,
-        end_y: int,
-        x_flipped: bool,
-        y_flipped: bool,
-        rotation: int,
-        reverse: bool = False,
     ):
         """
-        Create a number using the specified range as binary digits
+        The score a neighbour needs on the touching edge, it reads the same pixels the opposite way round
         """
-        if reverse:
-            start_x, end_x = end_x, start_x
-            start_y, end_y = end_y, start_y
-        # figure out the step
-        x_step = 1 if start_x <= end_x else -1
-        y_step = 1 if start_y <= end_y else -1
-
-        # and adjust the end location..
-        end_x += x_step
-        end_y += y_step
-
-        # and loop doing the addition
-        result = 0
-        for y in range(start_y, end_y, y_step):
-            for x in range(start_x, end_x, x_step):
-                # shift and add
-                result *= 2
-                if self.is_populated(x, y, x_flipped, y_flipped, rotation):
-                    result += 1
-        return result
+        return reverse_bits(
+            self.get_side_score(edge, rotation, x_flipped, y_flipped), self.tile_size
+        )
 
     def is_picture_populated(
         self, x: int, y: int, x_flipped: bool, y_flipped: bool, rotation: int
@@ -457,45 +448,20 @@ class Tile:
         self, x: int, y: int, x_flipped: bool, y_flipped: bool, rotation: int
     ):
         #
-        #  Apply the rotation and flip logic, see if that spot is occupied
+        #  Look the spot up in the rows for this rotation and flip, anything off the tile is empty
         #
-
-        #
-        #  basically we're just going to tweak the x/y read loaction based on flip and rotation
-        #
-
-        # flip first, simple enough
-        if x_flipped:
-            x = self.tile_max - x
-        if y_flipped:
-            y = self.tile_max - y
-
-        #
-        #  And now the rotationy stuff
-        #
-        # 90 degrees clockwise, so top left (x=2, y=1) -> (x=8,y=2)  (so y=x, x=max-y)
-        # but that's the logic for moving a point, so we need to be thinking about where on the original pattern the source would be
-        # so, the thing that would show at
-        # a block at 0,8 needs to appear at 1, 0
-        # so when we read 1, 0, we actually need to read 0,8
-        # so target_x = y
-        # target_y = max - x
-        if 90 <= rotation:
-            x, y = y, self.tile_max - x
-        if 180 <= rotation:
-            x, y = y, self.tile_max - x
-        if 270 <= rotation:
-            x, y = y, self.tile_max - x
-
-        # and get the actual value
-        return (x, y) in self.raw_image
+        if x < 0 or y < 0 or x > self.tile_max or y > self.tile_max:
+            return False
+        row = self.oriented_rows(rotation, x_flipped, y_flipped)[y]
+        return 1 == (row >> (self.tile_max - x)) & 1
 
     def set_populated(self, x: int, y: int):
         """
         Store a raw x,y value for a hit.
         Rotation and flip is ignored for this as this is intended for loading the initial data
         """
-        self.raw_image[(x, y)] = True
+        self.rows[y] |= 1 << (self.tile_max - x)
+        self.orientations = None
 
     def print(self, rotation=0, x_flipped=False, y_flipped=False):
         """
@@ -518,9 +484,112 @@ class Tile:
         print("")
 
 
+def reverse_bits(value: int, bit_count: int):
+    """
+    Return value with its lowest bit_count bits in the opposite order
+    """
+    return int(format(value, f"0{bit_count}b")[::-1], 2)
+
+
+class EdgeIndex:
+    """
+    Every edge of every tile in every configuration, keyed by its canonical signature
+    (the smaller of the edge value and its reverse, so an edge and the edge that fits against it share a key)
+    each entry is (tile_no, rotation, x_flipped, y_flipped, edge, edge_value)
+    """
+
+    def __init__(self):
+        self.index = dict()
+        # canonical signature -> how many tiles have an edge with it, either way round
+        self.edge_frequency = Counter()
+
+    def canonical_signature(self, edge_value: int, edge_length: int):
+        return min(edge_value, reverse_bits(edge_value, edge_length))
+
+    def add_tile(self, the_tile):
+        for edge in (TOP, RIGHT, BOTTOM, LEFT):
+            edge_value = the_tile.get_side_score(edge, 0, False, False)
+            self.edge_frequency[
+                self.canonical_signature(edge_value, the_tile.tile_size)
+            ] += 1
+        for rotation, x_flipped, y_flipped in distinct_tile_configurations():
+            for edge in (TOP, RIGHT, BOTTOM, LEFT):
+                edge_value = the_tile.get_side_score(edge, rotation, x_flipped, y_flipped)
+                signature = self.canonical_signature(edge_value, the_tile.tile_size)
+                self.index.setdefault(signature, []).append(
+                    (the_tile.tile_no, rotation, x_flipped, y_flipped, edge, edge_value)
+                )
+
+    def candidates(self, edge: int, required_value: int, edge_length: int):
+        """
+        Return (tile_no, rotation, x_flipped, y_flipped) for every placement whose edge scores required_value
+        """
+        signature = self.canonical_signature(required_value, edge_length)
+        return [
+            (tile_no, rotation, x_flipped, y_flipped)
+            for tile_no, rotation, x_flipped, y_flipped, this_edge, edge_value in self.index.get(
+                signature, ()
+            )
+            if this_edge == edge and edge_value == required_value
+        ]
+
+    def is_unmatched(self, the_tile, edge: int, rotation=0, x_flipped=False, y_flipped=False):
+        """
+        True if no other tile has an edge that could go against this one, so it must be on the outside
+        """
+        edge_value = the_tile.get_side_score(edge, rotation, x_flipped, y_flipped)
+        signature = self.canonical_signature(edge_value, the_tile.tile_size)
+        return 1 == self.edge_frequency[signature]
+
+    def unmatched_edge_count(self, the_tile):
+        return sum(
+            1 for edge in (TOP, RIGHT, BOTTOM, LEFT) if self.is_unmatched(the_tile, edge)
+        )
+
+
+class TileBag(dict):
+    """
+    tile_no -> Tile, plus the EdgeIndex for all of them
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.edge_index = EdgeIndex()
+
+    def build_edge_index(self):
+        self.edge_index = EdgeIndex()
+        for the_tile in self.values():
+            self.edge_index.add_tile(the_tile)
+
+    def corner_tiles(self):
+        """
+        Return the tile numbers with two edges that match nothing else, if the edges are all
+        unique that's exactly the four corners and no solving is needed
+        """
+        return [
+            tile_no
+            for tile_no, the_tile in self.items()
+            if 2 == self.edge_index.unmatched_edge_count(the_tile)
+        ]
+
+    def answer_part1_from_corners(self, verbose=True):
+        """
+        Multiply the ids of the corner tiles together, straight from the edge frequencies
+        """
+        corners = self.corner_tiles()
+        if 4 != len(corners):
+            raise RuntimeError(
+                f"Expected 4 tiles with two unmatched edges, found {len(corners)}: {corners}"
+            )
+        result = math.prod(corners)
+        if verbose:
+            print(f"answer_part1_from_corners returns {result} (corners are {corners})")
+        return result
+
+
 # create a tilebag from the tiles in a file..
-def load_tiles_from_file(filename: str):
-    result = dict()
+def load_tiles_from_file(filename: str, verbose=True):
+    result = TileBag()
     current_tile_no = None
     y = None
 
@@ -528,23 +597,31 @@ def load_tiles_from_file(filename: str):
         for this_line in f:
             this_line = this_line.strip()
             if "" != this_line:
-                print(f"Processing: {this_line}")
+                if verbose:
+                    print(f"Processing: {this_line}")
                 if this_line.startswith("Tile "):
                     # format is Tile 1234:
                     number_part = this_line[5:-1]
                     current_tile_no = int(number_part)
-                    print(f"loading tile {current_tile_no}")
+                    if verbose:
+                        print(f"loading tile {current_tile_no}")
                     if current_tile_no in result:
                         raise RuntimeError(f"Duplicate tile number {current_tile_no}")
-                    result[current_tile_no] = Tile(current_tile_no)
                     y = 0
                 else:
-                    # this is a tile information line
+                    # this is a tile information line, the first one tells us how big the tile is
+                    if 0 == y:
+                        result[current_tile_no] = Tile(
+                            current_tile_no, tile_size=len(this_line)
+                        )
                     for x, this_char in enumerate(this_line):
                         if "#" == this_char:
                             result[current_tile_no].set_populated(x, y)
                     y += 1
 
+    # and index every edge so the solver can look candidates up
+    result.build_edge_index()
+
     return result
 
 
@@ -585,6 +662,17 @@ class PlacedTile:
             x, y, self.x_flipped, self.y_flipped, self.rotation
         )
 
+    def picture_rows(self):
+        """
+        Return the rows of this tile as placed with the frame taken off
+        """
+        picture_dimension = self.base_tile.picture_dimension()
+        mask = (1 << picture_dimension) - 1
+        rows = self.base_tile.oriented_rows(
+            self.rotation, self.x_flipped, self.y_flipped
+        )
+        return [(row >> 1) & mask for row in rows[1:-1]]
+
 
 def all_possible_tile_configurations():
     """
@@ -599,8 +687,21 @@ def all_possible_tile_configurations():
     return result
 
 
+def distinct_tile_configurations():
+    """
+    return the 8 tuples of rotation, x_flip, y_flip that give different pictures
+    (all_possible_tile_configurations has each of them twice, a y flip is a 180 turn plus an x flip)
+    """
+    return [
+        (rotation, x_flip, y_flip)
+        for rotation, x_flip, y_flip in all_possible_tile_configurations()
+        if not y_flip
+    ]
+
+
 class TileBoard:
-    def __init__(self, tilebag: dict):
+    def __init__(self, tilebag: dict, verbose=True):
+        self.verbose = verbose
         self.board = dict()
         self.remaining_tiles = list(tilebag.keys())
         self.tilebag = tilebag
@@ -619,38 +720,33 @@ class TileBoard:
         tile_dimension = individual_tile_dimension * self.max_dimension
         print(f"we will create a tile of {tile_dimension}x{tile_dimension}")
 
-        t = Tile(42, tile_size=tile_dimension)
-
-        target_x = 0
-        target_y = 0
+        rows = []
 
         # so now we need to iterate through each row of placed tiles..
         for tile_y in range(self.min_y, self.max_y + 1):
+            row_tiles = [
+                self.board[(tile_x, tile_y)].picture_rows()
+                for tile_x in range(self.min_x, self.max_x + 1)
+            ]
             # for this row we need to build up per-line wide tile values..
             for in_tile_y in range(individual_tile_dimension):
-                # now iterate across each tile in the board
-                target_x = 0
-                for tile_x in range(self.min_x, self.max_x + 1):
-                    # and through each tile
-                    for in_tile_x in range(individual_tile_dimension):
-                        # get this value and add it to the row
-                        if self.board[(tile_x, tile_y)].is_picture_populated(
-                            in_tile_x, in_tile_y
-                        ):
-                            t.set_populated(target_x, target_y)
-                        # next x
-                        target_x += 1
-                # and next y
-                target_y += 1
-                print(f"Target line is now: {target_y}")
-
+                # and stick the picture part of each tile on the end of the line
+                this_row = 0
+                for picture_rows in row_tiles:
+                    this_row = (this_row << individual_tile_dimension) | picture_rows[
+                        in_tile_y
+                    ]
+                rows.append(this_row)
+                print(f"Target line is now: {len(rows)}")
+
+        t = Tile.from_rows(42, rows, tile_size=tile_dimension)
         return t
 
     def copy(self):
         """
         Return a duplicate of this board..
         """
-        t = TileBoard(self.tilebag)
+        t = TileBoard(self.tilebag, self.verbose)
         t.board = self.board.copy()
         t.remaining_tiles = self.remaining_tiles.copy()
         t.min_x = self.min_x
@@ -725,9 +821,7 @@ class TileBoard:
         """
         Take this tile out of the tile list..
         """
-        s = set(self.remaining_tiles)
-        s.remove(tile_no)
-        self.remaining_tiles = list(s)
+        self.remaining_tiles.remove(tile_no)
 
     def answer_part1(self):
         """
@@ -769,25 +863,32 @@ class TileBoard:
                 )
                 # now make a copy and see if we can solve it this way..
                 this_attempt = self.copy()
-                this_attempt.print()
+                if self.verbose:
+                    this_attempt.print()
                 solved_board = this_attempt.solve()
                 if solved_board is not None:
-                    print(f"WooHoo - found a winner!")
+                    if self.verbose:
+                        print(f"WooHoo - found a winner!")
                     return solved_board
         else:
 
             # Victory condition, we have placed everything...
             if 0 == len(self.remaining_tiles):
-                print(f"This is SPAARTAAAA!")
-                self.print()
+                if self.verbose:
+                    print(f"This is SPAARTAAAA!")
+                    self.print()
                 return self
 
+            remaining = set(self.remaining_tiles)
+
             # ok, we have a board and we need to place a piece..
             # for all the pieces we have already placed, check each un-used edge and see whether we can place a tile there..
-            for this_placed_tile in self.board:
+            # newest tiles first, they are the ones most likely to still have an open edge
+            for this_placed_tile in reversed(self.board):
                 the_tile = self.board[this_placed_tile]
                 x, y = this_placed_tile
-                print(f"evaluating the tile at {x},{y}")
+                if self.verbose:
+                    print(f"evaluating the tile at {x},{y}")
                 # can we find a match for any of the edges here ?
                 edges = [TOP, RIGHT, BOTTOM, LEFT]
                 for target_edge in edges:
@@ -811,64 +912,180 @@ class TileBoard:
                                 target_edge
                             )
 
-                            print(
-                                f"base tile at {x},{y}: trying to place at location {target_x},{target_y} ({dir_name(target_edge)}) which requires {required_value_for_edge}"
-                            )
-
-                            # now run through every possible tile in every possible combination and see if it is possible
-                            for candidate_tile_no in self.remaining_tiles:
-                                print(f"considering tile {candidate_tile_no}")
-                                # there's definitely some optimisation to be had here, but we'll come back if it's too slow
-                                # try the target tile every which way..
+                            if self.verbose:
+                                print(
+                                    f"base tile at {x},{y}: trying to place at location {target_x},{target_y} ({dir_name(target_edge)}) which requires {required_value_for_edge}"
+                                )
+
+                            # the edge index gives us every tile + configuration with that edge value straight away
+                            for (
+                                candidate_tile_no,
+                                candidate_rotation,
+                                candidate_x_flip,
+                                candidate_y_flip,
+                            ) in self.tilebag.edge_index.candidates(
+                                candidate_edge,
+                                required_value_for_edge,
+                                the_tile.base_tile.tile_size,
+                            ):
+                                if candidate_tile_no not in remaining:
+                                    continue
                                 candidate_tile = self.tilebag[candidate_tile_no]
-                                for (
-                                    this_tile_configuration
-                                ) in all_possible_tile_configurations():
-                                    (
+                                if self.verbose:
+                                    print(
+                                        f"Found a potential match: {this_placed_tile} on edge {dir_name(target_edge)} matches with {candidate_tile_no} ({candidate_rotation, candidate_x_flip, candidate_y_flip})"
+                                    )
+                                    the_tile.print()
+                                    candidate_tile.print(
                                         candidate_rotation,
                                         candidate_x_flip,
                                         candidate_y_flip,
-                                    ) = this_tile_configuration
-                                    if (
-                                        candidate_tile.get_side_score(
-                                            candidate_edge,
-                                            candidate_rotation,
-                                            candidate_x_flip,
-                                            candidate_y_flip,
-                                        )
-                                        == required_value_for_edge
-                                    ):
-                                        print(
-                                            f"Found a potential match: {this_placed_tile} on edge {dir_name(target_edge)} matches with {candidate_tile_no} ({candidate_rotation, candidate_x_flip, candidate_y_flip})"
-                                        )
-                                        the_tile.print()
-                                        candidate_tile.print(
-                                            candidate_rotation,
-                                            candidate_x_flip,
-                                            candidate_y_flip,
-                                        )
-                                        # try this match as a final solution
-                                        # now make a copy and see if we can solve it this way..
-                                        this_attempt = self.copy()
-                                        this_attempt.place_tile(
-                                            candidate_tile,
-                                            target_x,
-                                            target_y,
-                                            candidate_rotation,
-                                            candidate_x_flip,
-                                            candidate_y_flip,
-                                        )
-                                        this_attempt.remove_remaining_tile(
-                                            candidate_tile_no
-                                        )
-                                        this_attempt.print()
-                                        solved_board = this_attempt.solve()
-                                        if solved_board is not None:
-                                            print(f"WooHoo - found a winner!")
-                                            return solved_board
+                                    )
+                                # try this match as a final solution
+                                # now make a copy and see if we can solve it this way..
+                                this_attempt = self.copy()
+                                this_attempt.place_tile(
+                                    candidate_tile,
+                                    target_x,
+                                    target_y,
+                                    candidate_rotation,
+                                    candidate_x_flip,
+                                    candidate_y_flip,
+                                )
+                                this_attempt.remove_remaining_tile(candidate_tile_no)
+                                if self.verbose:
+                                    this_attempt.print()
+                                solved_board = this_attempt.solve()
+                                if solved_board is not None:
+                                    if self.verbose:
+                                        print(f"WooHoo - found a winner!")
+                                    return solved_board
 
         return None
 
+    def take_back_tile(self, placement):
+        """
+        Undo one entry from the solve_in_place undo log, (x, y, tile_no, bounds before it went down)
+        """
+        x, y, tile_no, previous_bounds = placement
+        del self.board[(x, y)]
+        self.min_x, self.max_x, self.min_y, self.max_y = previous_bounds
+
+    def slot_candidates(self, x: int, y: int, remaining: set, seed_corners=()):
+        """
+        Return the (tile_no, rotation, x_flipped, y_flipped) placements that fit at x,y
+        given the tiles to the left and above, the only neighbours there can be when filling row by row
+        seed_corners limits the top left slot to those tiles
+        """
+        tile_size = next(iter(self.tilebag.values())).tile_size
+        left_tile = self.get_tile(x - 1, y)
+        top_tile = self.get_tile(x, y - 1)
+
+        if left_tile is not None:
+            result = self.tilebag.edge_index.candidates(
+                LEFT, left_tile.get_required_edge_value(RIGHT), tile_size
+            )
+            if top_tile is not None:
+                required_top = top_tile.get_required_edge_value(BOTTOM)
+                result = [
+                    (tile_no, rotation, x_flipped, y_flipped)
+                    for tile_no, rotation, x_flipped, y_flipped in result
+                    if required_top
+                    == self.tilebag[tile_no].get_side_score(
+                        TOP, rotation, x_flipped, y_flipped
+                    )
+                ]
+        elif top_tile is not None:
+            result = self.tilebag.edge_index.candidates(
+                TOP, top_tile.get_required_edge_value(BOTTOM), tile_size
+            )
+        elif seed_corners:
+            # the top left corner, a corner tile turned so its unmatched edges face up and left
+            edge_index = self.tilebag.edge_index
+            result = [
+                (tile_no, rotation, x_flipped, y_flipped)
+                for tile_no in seed_corners
+                for rotation, x_flipped, y_flipped in distinct_tile_configurations()
+                if edge_index.is_unmatched(
+                    self.tilebag[tile_no], TOP, rotation, x_flipped, y_flipped
+                )
+                and edge_index.is_unmatched(
+                    self.tilebag[tile_no], LEFT, rotation, x_flipped, y_flipped
+                )
+            ]
+        else:
+            # the top left corner, anything goes
+            result = [
+                (tile_no, rotation, x_flipped, y_flipped)
+                for tile_no in self.remaining_tiles
+                for rotation, x_flipped, y_flipped in distinct_tile_configurations()
+            ]
+
+        return [placement for placement in result if placement[0] in remaining]
+
+    def solve_in_place(self, seed_corners=True):
+        """
+        Fill an empty board row by row from 0,0 without copying it, every placement goes on an
+        undo log and backtracking takes the last one back off. Returns self if it worked, otherwise None
+        nodes_visited and backtracks are left on the board afterwards
+        With seed_corners the search starts from the corners found by the edge frequencies
+        (if there aren't exactly 4 of them every tile gets tried at 0,0)
+        """
+        corners = ()
+        if seed_corners:
+            corners = self.tilebag.corner_tiles()
+            if 4 != len(corners):
+                corners = ()
+
+        slots = [
+            (x, y)
+            for y in range(self.max_dimension)
+            for x in range(self.max_dimension)
+        ]
+        remaining = set(self.remaining_tiles)
+        undo_log = []
+        self.nodes_visited = 0
+        self.backtracks = 0
+
+        # one iterator of candidates per slot we're working on
+        choices = [iter(self.slot_candidates(*slots[0], remaining, corners))]
+        while choices:
+            placement = next(choices[-1], None)
+            if placement is None:
+                # nothing else fits here, so the tile before this one was wrong
+                choices.pop()
+                if undo_log:
+                    last_placement = undo_log.pop()
+                    self.take_back_tile(last_placement)
+                    remaining.add(last_placement[2])
+                    self.backtracks += 1
+                continue
+
+            tile_no, rotation, x_flipped, y_flipped = placement
+            x, y = slots[len(undo_log)]
+            previous_bounds = (self.min_x, self.max_x, self.min_y, self.max_y)
+            self.place_tile(self.tilebag[tile_no], x, y, rotation, x_flipped, y_flipped)
+            remaining.remove(tile_no)
+            undo_log.append((x, y, tile_no, previous_bounds))
+            self.nodes_visited += 1
+
+            if len(undo_log) == len(slots):
+                self.remaining_tiles = []
+                if self.verbose:
+                    print(
+                        f"This is SPAARTAAAA! ({self.nodes_visited} nodes visited, {self.backtracks} backtracks)"
+                    )
+                    self.print()
+                return self
+
+            choices.append(iter(self.slot_candidates(*slots[len(undo_log)], remaining)))
+
+        if self.verbose:
+            print(
+                f"No solution ({self.nodes_visited} nodes visited, {self.backtracks} backtracks)"
+            )
+        return None
+
 
 # tile basic testing..
 if False:
@@ -894,74 +1111,118 @@ if False:
     exit(1)
 
 
-def count_monster_matches(picture, monster_coordinates, rotation, x_flip, y_flip):
+def monster_row_masks(monster_image):
     """
-    count every location that the monster picture matches everything in
+    Turn a monster picture (list of strings, # is monster) into (width, list of row masks)
+    the leftmost character is the top bit of each mask, same as the Tile rows
     """
-    result = 0
-    for x in range(picture.tile_size):
-        for y in range(picture.tile_size):
-            # do we have a full match
-            matches = [
-                picture.is_populated(x + x_off, y + y_off, x_flip, y_flip, rotation)
-                for x_off, y_off in monster_coordinates
-            ]
-            all_match = all(matches)
-            if all_match:
-                print(f"Found a monster at {x},{y}")
-                result += 1
+    width = max(len(the_line) for the_line in monster_image)
+    masks = [
+        int(the_line.ljust(width).replace("#", "1").replace(" ", "0").replace(".", "0"), 2)
+        for the_line in monster_image
+    ]
+    return width, masks
+
+
+def find_monsters(rows, picture_width: int, monster_image):
+    """
+    Slide the monster masks across a list of row ints picture_width pixels wide,
+    returns the (x, y) of the top left of every match
+    """
+    monster_width, masks = monster_row_masks(monster_image)
+    result = []
+    for y in range(len(rows) - len(masks) + 1):
+        for x in range(picture_width - monster_width + 1):
+            shift = picture_width - monster_width - x
+            if all(
+                (rows[y + y_off] >> shift) & mask == mask
+                for y_off, mask in enumerate(masks)
+            ):
+                result.append((x, y))
     return result
 
 
-# main program
-# so let's get that data in here..
-filename = "sample.txt"
-filename = "input.txt"
-tilebag = load_tiles_from_file(filename)
-# and create a board to solve..
-board = TileBoard(tilebag)
-board.print()
-solved = board.solve()
+def scan_for_monsters(picture, monster_image):
+    """
+    Look for the monster in all 8 orientations of the picture and pick the one with the most,
+    returns ((rotation, x_flip, y_flip), [(x, y) of each monster], rough sea count)
+    rough sea is whatever is populated and not part of any monster, overlapping monsters only count once
+    """
+    monster_width, masks = monster_row_masks(monster_image)
+    best_configuration = None
+    best_locations = []
+    for configuration in distinct_tile_configurations():
+        rows = picture.oriented_rows(*configuration)
+        locations = find_monsters(rows, picture.tile_size, monster_image)
+        if best_configuration is None or len(locations) > len(best_locations):
+            best_configuration = configuration
+            best_locations = locations
+
+    # knock the monsters out of the picture and count what's left
+    rows = list(picture.oriented_rows(*best_configuration))
+    for x, y in best_locations:
+        shift = picture.tile_size - monster_width - x
+        for y_off, mask in enumerate(masks):
+            rows[y + y_off] &= ~(mask << shift)
+    rough_sea = sum(bin(row).count("1") for row in rows)
+
+    return best_configuration, best_locations, rough_sea
 
-solved.answer_part1()
 
-#
-#  ok, so we need to get the picture out as a single thing ideally, let's do that first
-#
-picture = solved.picture_as_tile()
-picture.print()
+# main program
+if __name__ == "__main__":
+    # so let's get that data in here..
+    filename = "sample.txt"
+    filename = "input.txt"
+    tilebag = load_tiles_from_file(filename)
+    # and create a board to solve..
+    board = TileBoard(tilebag)
+    board.print()
+    use_undo_log = True
+    if use_undo_log:
+        solved = board.solve_in_place()
+    else:
+        solved = board.solve()
+
+    # the corners can be found without solving anything, they should agree
+    if solved.answer_part1() != tilebag.answer_part1_from_corners():
+        print(f"Problem here chief..")
+        exit(1)
 
-#
-#  We have the tile, now we need to see how many sea-monsters there are..
-#
-monster_image = ["                  # ", "#    ##    ##    ###", " #  #  #  #  #  #   "]
-monster_coordinates = []
-for y, the_line in enumerate(monster_image):
-    print(f"y:{y} -> [{the_line}]")
-    for x, the_char in enumerate(the_line):
-        if "#" == the_char:
-            monster_coordinates.append((x, y))
-print(f"monster is: {monster_coordinates}")
+    #
+    #  ok, so we need to get the picture out as a single thing ideally, let's do that first
+    #
+    picture = solved.picture_as_tile()
+    picture.print()
+
+    #
+    #  We have the tile, now we need to see how many sea-monsters there are..
+    #
+    monster_image = ["                  # ", "#    ##    ##    ###", " #  #  #  #  #  #   "]
+    monster_coordinates = []
+    for y, the_line in enumerate(monster_image):
+        print(f"y:{y} -> [{the_line}]")
+        for x, the_char in enumerate(the_line):
+            if "#" == the_char:
+                monster_coordinates.append((x, y))
+    print(f"monster is: {monster_coordinates}")
 
-#
-#  Now we have the pattern to match, we can do some very dumb iteration to run through the tile in every combination and see whether we have a match:
-#
-best_monster_count = 0
-for rotation, x_flip, y_flip in all_possible_tile_configurations():
     #
-    #  Search this tile for the monster
+    #  Now we have the pattern to match, slide it across every orientation of the picture as row masks
     #
-    x = count_monster_matches(picture, monster_coordinates, rotation, x_flip, y_flip)
-    if x > best_monster_count:
-        best_monster_count = x
-    print(f"{rotation},{x_flip},{y_flip} -> {x}")
-
-# we have the counts, let's finish up..
-tiles_in_monster = len(monster_coordinates)
-tiles_in_picture = picture.total_tiles()
-removed_for_monster = tiles_in_monster * best_monster_count
-rough_sea_tiles = tiles_in_picture - removed_for_monster
-
-print(
-    f"We found {best_monster_count} monsters, each with {tiles_in_monster} tiles, the picture had {tiles_in_picture} tiles, removing {removed_for_monster} for monsters, that leaves {rough_sea_tiles} rough sea tiles"
-)
+    configuration, monster_locations, rough_sea_tiles = scan_for_monsters(
+        picture, monster_image
+    )
+    for x, y in monster_locations:
+        print(f"Found a monster at {x},{y}")
+    print(f"best orientation (rotation, x_flip, y_flip) is {configuration}")
+
+    # we have the counts, let's finish up..
+    best_monster_count = len(monster_locations)
+    tiles_in_monster = len(monster_coordinates)
+    tiles_in_picture = picture.total_tiles()
+    removed_for_monster = tiles_in_picture - rough_sea_tiles
+
+    print(
+        f"We found {best_monster_count} monsters, each with {tiles_in_monster} tiles, the picture had {tiles_in_picture} tiles, removing {removed_for_monster} for monsters, that leaves {rough_sea_tiles} rough sea tiles"
+    )
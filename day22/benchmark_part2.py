@@ -0,0 +1,93 @@
+#
+#  Benchmark the recursive combat engines, play_combat (list decks, tuple loop keys)
+#  against play_combat_cached (deque decks, rolling hash loop keys, sub-game memo)
+#
+#  The original prints the score at the end of every sub-game so its output is thrown away.
+#  Random decks get exponentially harder as they grow, past 30 cards each the original takes
+#  far too long so only the cached version runs.
+#
+import contextlib
+import io
+import random
+import time
+
+from day22_part2 import (
+    Deck,
+    HashedDeck,
+    load_decks,
+    new_combat_stats,
+    play_combat,
+    play_combat_cached,
+)
+
+# (cards per player, how many generated games)
+generated_sizes = [(10, 200), (25, 20), (30, 5), (35, 5)]
+original_max_cards = 30
+
+
+def generate_cards(cards_per_player, seed):
+    """
+    shuffle 1..2n and deal half to each player
+    """
+    rng = random.Random(seed)
+    cards = list(range(1, 2 * cards_per_player + 1))
+    rng.shuffle(cards)
+    return cards[:cards_per_player], cards[cards_per_player:]
+
+
+def time_original(card_pairs):
+    start_time = time.perf_counter()
+    results = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for cards1, cards2 in card_pairs:
+            deck1 = Deck("Player 1")
+            deck1.cards = list(cards1)
+            deck2 = Deck("Player 2")
+            deck2.cards = list(cards2)
+            first_player_wins = play_combat(deck1, deck2)
+            results.append((deck1 if first_player_wins else deck2).score())
+    return results, time.perf_counter() - start_time
+
+
+def time_cached(card_pairs):
+    start_time = time.perf_counter()
+    results = []
+    stats = new_combat_stats()
+    for cards1, cards2 in card_pairs:
+        deck1 = HashedDeck("Player 1", cards=cards1)
+        deck2 = HashedDeck("Player 2", cards=cards2)
+        first_player_wins = play_combat_cached(deck1, deck2, stats=stats)
+        results.append((deck1 if first_player_wins else deck2).score())
+    return results, time.perf_counter() - start_time, stats
+
+
+def compare(description, card_pairs, run_original=True):
+    cached_results, cached_time, stats = time_cached(card_pairs)
+    if not run_original:
+        print(f"{description:28} original=     n/a  cached={cached_time:8.3f}s {stats}")
+        return
+    original_results, original_time = time_original(card_pairs)
+    print(
+        f"{description:28} original={original_time:8.3f}s cached={cached_time:8.3f}s "
+        f"speedup={original_time / cached_time:6.1f}x same_scores={original_results == cached_results} {stats}"
+    )
+    if original_results != cached_results:
+        print(f"Problem here chief..")
+        exit(1)
+
+
+# main
+if __name__ == "__main__":
+    with contextlib.redirect_stdout(io.StringIO()):
+        p1, p2 = load_decks("input.txt")
+    compare("input.txt", [(p1.cards, p2.cards)])
+
+    for cards_per_player, game_count in generated_sizes:
+        card_pairs = [
+            generate_cards(cards_per_player, seed) for seed in range(game_count)
+        ]
+        compare(
+            f"{game_count} x {cards_per_player} card decks",
+            card_pairs,
+            run_original=cards_per_player <= original_max_cards,
+        )
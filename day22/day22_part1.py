@@ -106,9 +106,13 @@
 # To begin, get your puzzle input.
 
 
+from collections import deque
+from multiprocessing import Pool
+
+
 class Deck:
-    def __init__(self, name: str):
-        self.cards = list()
+    def __init__(self, name: str, cards=()):
+        self.cards = deque(cards)
         self.name = name
 
     def count(self):
@@ -118,20 +122,19 @@ class Deck:
         self.cards.append(card)
 
     def deal(self):
-        result = self.cards[0]
-        self.cards = self.cards[1:]
-        return result
+        return self.cards.popleft()
 
     def print(self):
-        print(f"Deck {self.name}: {self.cards}")
+        print(f"Deck {self.name}: {list(self.cards)}")
 
     def has_cards(self):
         return self.count() > 0
 
-    def score(self):
+    def score(self, verbose=True):
         result = 0
         for multiplier, value in enumerate(reversed(self.cards), start=1):
-            print(f"Scoring: adding {multiplier} * {value} to the total")
+            if verbose:
+                print(f"Scoring: adding {multiplier} * {value} to the total")
             result += multiplier * value
         return result
 
@@ -157,9 +160,10 @@ def load_decks(filename):
     return tuple(result)
 
 
-def play_combat(deck1, deck2):
+def play_combat(deck1, deck2, verbose=True):
     """
     Play the game, see who wins
+    returns (winning score, number of rounds played)
     """
     round_no = 1
     while deck1.has_cards() and deck2.has_cards():
@@ -173,22 +177,44 @@ def play_combat(deck1, deck2):
         else:
             deck2.add_to_bottom(card2)
             deck2.add_to_bottom(card1)
-        print(f"Round {round_no}:")
-        deck1.print()
-        deck2.print()
+        if verbose:
+            print(f"Round {round_no}:")
+            deck1.print()
+            deck2.print()
         round_no += 1
 
     if deck1.has_cards():
-        score = deck1.score()
+        score = deck1.score(verbose)
     else:
-        score = deck2.score()
+        score = deck2.score(verbose)
 
-    print(f"Winning score is {score}")
+    if verbose:
+        print(f"Winning score is {score}")
+    return score, round_no - 1
 
 
-# load the decks..
-filename = "input.txt"
-p1, p2 = load_decks(filename)
-p1.print()
-p2.print()
-play_combat(p1, p2)
+def play_card_pair(card_pair):
+    """
+    Play one quiet game from a (player 1 cards, player 2 cards) pair, returns (winning score, rounds)
+    """
+    cards1, cards2 = card_pair
+    return play_combat(Deck("Player 1", cards1), Deck("Player 2", cards2), verbose=False)
+
+
+def play_batch(card_pairs, processes=None, chunksize=64):
+    """
+    Play a whole list of (player 1 cards, player 2 cards) games across a process pool,
+    processes=None uses every cpu, returns a list of (winning score, rounds) in the same order
+    """
+    with Pool(processes) as pool:
+        return pool.map(play_card_pair, card_pairs, chunksize)
+
+
+# main
+if __name__ == "__main__":
+    # load the decks..
+    filename = "input.txt"
+    p1, p2 = load_decks(filename)
+    p1.print()
+    p2.print()
+    play_combat(p1, p2)
@@ -371,6 +371,10 @@
 # Defend your honor as Raft Captain by playing the small crab in a game of Recursive Combat using the same two decks as before. What is the winning player's score?
 
 
+from collections import deque
+from itertools import islice
+
+
 class Deck:
     def __init__(self, name: str, level: int = 0):
         self.cards = list()
@@ -490,10 +494,172 @@ def play_combat(deck1, deck2):
 
 
 # load the decks..
-filename = "helping.txt"
-p1, p2 = load_decks(filename)
+# a faster deck for the recursive game
+#   the cards live in a deque so dealing off the top is O(1)
+#   and the deck keeps a polynomial hash of its cards that's updated as cards come and go,
+#   top card * B^(n-1) + ... + bottom card, all mod a 61 bit prime.  That's cheap enough to check
+#   every round instead of building a tuple of the whole deck each time.
+hash_modulus = (1 << 61) - 1
+hash_base = 1000003
+hash_base_squared = hash_base * hash_base % hash_modulus
+hash_powers = [1]
+
+
+class HashedDeck:
+    def __init__(self, name: str, level: int = 0, cards=()):
+        self.cards = deque()
+        self.name = name
+        self.level = level
+        self.hash_value = 0
+        for card in cards:
+            self.add_to_bottom(card)
+
+    def tuple(self):
+        return tuple(self.cards)
+
+    def count(self):
+        return len(self.cards)
+
+    def add_to_bottom(self, card: int):
+        self.cards.append(card)
+        self.hash_value = (self.hash_value * hash_base + card) % hash_modulus
+        # make sure there's a power ready for every card we hold
+        if len(hash_powers) < len(self.cards):
+            hash_powers.append(hash_powers[-1] * hash_base % hash_modulus)
+
+    def add_pair_to_bottom(self, first_card: int, second_card: int):
+        """
+        add_to_bottom twice, with a single hash update
+        """
+        self.cards.append(first_card)
+        self.cards.append(second_card)
+        self.hash_value = (
+            self.hash_value * hash_base_squared + first_card * hash_base + second_card
+        ) % hash_modulus
+        while len(hash_powers) < len(self.cards):
+            hash_powers.append(hash_powers[-1] * hash_base % hash_modulus)
+
+    def deal(self):
+        result = self.cards.popleft()
+        # the top card was multiplied by B^(cards left)
+        self.hash_value = (
+            self.hash_value - result * hash_powers[len(self.cards)]
+        ) % hash_modulus
+        return result
+
+    def print(self):
+        print(f"Deck {self.name}({self.level}): {list(self.cards)}")
+
+    def has_cards(self):
+        return self.count() > 0
+
+    def score(self):
+        result = 0
+        for multiplier, value in enumerate(reversed(self.cards), start=1):
+            result += multiplier * value
+        return result
+
+    def subdeck(self, number_of_cards: int):
+        """
+        duplicate up this deck but only the top x cards..
+        """
+        return HashedDeck(
+            self.name, self.level + 1, islice(self.cards, 0, number_of_cards)
+        )
+
+
+def new_combat_stats():
+    return {"games": 0, "rounds": 0, "memo_hits": 0, "shortcut_wins": 0}
+
+
+def play_combat_cached(deck1, deck2, memo=None, stats=None):
+    """
+    Play the game with HashedDecks, see who wins (True if it's player 1)
+      - a repeated configuration is spotted from the two deck hashes and the deck sizes
+      - the winner of every game is remembered against its starting decks in memo, so a sub-game
+        that's been played before returns straight away
+      - a sub-game where player 1 holds the highest card is a player 1 win without playing it
+    unlike play_combat this one doesn't print the score, ask the decks afterwards
+    """
+    if memo is None:
+        memo = dict()
+    if stats is None:
+        stats = new_combat_stats()
+
+    # in a sub-game the highest card can never be recursed on (it's bigger than the number of
+    # cards left in play) so it wins every round it's in, whoever holds it can't lose the game,
+    # and if that's player 1 a repeat or player 2 running out are both player 1 wins
+    if deck1.level > 0 and max(deck1.cards) > max(deck2.cards):
+        stats["shortcut_wins"] += 1
+        return True
 
-p1.print()
-p2.print()
+    starting_decks = (deck1.tuple(), deck2.tuple())
+    if starting_decks in memo:
+        stats["memo_hits"] += 1
+        return memo[starting_decks]
+    stats["games"] += 1
+
+    first_player_wins_game = None
+    previous_configurations = set()
+    rounds = 0
+    cards1 = deck1.cards
+    cards2 = deck2.cards
+    while cards1 and cards2:
+        rounds += 1
+
+        # have we seen this configuration before ?
+        configuration_key = (deck1.hash_value, deck2.hash_value, len(cards1))
+        if configuration_key in previous_configurations:
+            first_player_wins_game = True
+            break
+        previous_configurations.add(configuration_key)
+
+        # get the top cards and see who wins..
+        card1 = deck1.deal()
+        card2 = deck2.deal()
 
-play_combat(p1, p2)
+        # can we do recursive battle ?
+        if len(cards1) >= card1 and len(cards2) >= card2:
+            first_player_wins_round = play_combat_cached(
+                deck1.subdeck(card1), deck2.subdeck(card2), memo, stats
+            )
+        else:
+            first_player_wins_round = card1 > card2
+
+        if first_player_wins_round:
+            deck1.add_pair_to_bottom(card1, card2)
+        else:
+            deck2.add_pair_to_bottom(card2, card1)
+    stats["rounds"] += rounds
+
+    if first_player_wins_game is None:
+        first_player_wins_game = deck1.has_cards()
+
+    memo[starting_decks] = first_player_wins_game
+    return first_player_wins_game
+
+
+def load_hashed_decks(filename):
+    """
+    load_decks but giving back HashedDecks
+    """
+    return tuple(HashedDeck(deck.name, cards=deck.cards) for deck in load_decks(filename))
+
+
+# main
+if __name__ == "__main__":
+    filename = "helping.txt"
+    p1, p2 = load_decks(filename)
+
+    p1.print()
+    p2.print()
+
+    play_combat(p1, p2)
+
+    # and the same again with the cached version
+    p1, p2 = load_hashed_decks(filename)
+    stats = new_combat_stats()
+    if play_combat_cached(p1, p2, stats=stats):
+        print(f"Cached: winning p1 score is {p1.score()}, {stats}")
+    else:
+        print(f"Cached: winning p2 score is {p2.score()}, {stats}")
@@ -0,0 +1,47 @@
+#
+#  Play a big part 1 tournament of generated deck pairs across a process pool
+#  and report how fast it went, games/sec and rounds/sec
+#
+#  usage:
+#     python tournament.py                          - 10000 games of 25 cards each, every cpu
+#     python tournament.py 100000 50 8              - games, cards per player, processes
+#
+import os
+import random
+import sys
+import time
+
+from day22_part1 import play_batch
+
+
+def generate_card_pairs(game_count, cards_per_player, seed=2020):
+    """
+    for each game shuffle 1..2n and deal half to each player
+    """
+    rng = random.Random(seed)
+    result = []
+    for _ in range(game_count):
+        cards = list(range(1, 2 * cards_per_player + 1))
+        rng.shuffle(cards)
+        result.append((cards[:cards_per_player], cards[cards_per_player:]))
+    return result
+
+
+# main
+if __name__ == "__main__":
+    game_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    cards_per_player = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    processes = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count()
+
+    card_pairs = generate_card_pairs(game_count, cards_per_player)
+
+    start_time = time.perf_counter()
+    results = play_batch(card_pairs, processes)
+    elapsed = time.perf_counter() - start_time
+
+    total_rounds = sum(rounds for score, rounds in results)
+    print(
+        f"games={game_count} cards/player={cards_per_player} processes={processes} time={elapsed:.2f}s "
+        f"games/sec={game_count / elapsed:.0f} rounds/sec={total_rounds / elapsed:.0f} "
+        f"average rounds/game={total_rounds / game_count:.1f}"
+    )
@@ -0,0 +1,119 @@
+#
+#  Microbenchmark for FastCircleList, slotted + pooled nodes against the old dict-backed nodes
+#
+#  "dict_nodes" uses a copy of Node as it was before it was slotted (a plain class, so every
+#  node has a __dict__) and turns the pool off, which is how the list behaved before.
+#
+import time
+import tracemalloc
+
+from fast_circle_list import FastCircleList
+
+
+# the old Node, deliberately not a subclass so none of the __slots__ come along
+class DictNode:
+    def __init__(self, the_value, previous_node, next_node):
+        self.value = the_value
+        if previous_node is None:
+            self.previous_node = self
+        else:
+            self.previous_node = previous_node
+
+        if next_node is None:
+            self.next_node = self
+        else:
+            self.next_node = next_node
+
+    def print(self):
+        print(f"{self.value}")
+
+    def __repr__(self):
+        return f"<{self.value}>"
+
+    def next(self):
+        return self.next_node
+
+    def set_next(self, target_node):
+        self.next_node = target_node
+
+    def set_prev(self, target_node):
+        self.previous_node = target_node
+
+    def previous(self):
+        return self.previous_node
+
+
+class DictNodeCircleList(FastCircleList):
+    node_class = DictNode
+
+    def __init__(self):
+        super().__init__(pool_nodes=False)
+
+
+node_count = 1000000
+op_count = 1000000
+
+variants = [
+    ("dict_nodes", DictNodeCircleList),
+    ("slotted_pooled", FastCircleList),
+]
+
+
+def build_list(list_class, count):
+    the_list = list_class()
+    for x in range(count):
+        the_list.append(x)
+    return the_list
+
+
+def measure_memory_per_node(list_class):
+    """
+    bytes allocated per node, includes the node and its share of the lookup dict
+    """
+    tracemalloc.start()
+    the_list = build_list(list_class, node_count)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del the_list
+    return allocated / node_count
+
+
+def measure_remove_add(the_list):
+    """
+    remove the node after the current one and add it straight back, the same as the crab does
+    """
+    start_time = time.perf_counter()
+    for _ in range(op_count):
+        removed_value = the_list.remove_next_node()
+        the_list.add_after(the_list.get_current_node(), removed_value)
+        the_list.set_current_node(the_list.get_current_node().next())
+    return op_count / (time.perf_counter() - start_time)
+
+
+def measure_move_after(the_list):
+    """
+    move the node after the current one two places further on, no lookup changes at all
+    """
+    start_time = time.perf_counter()
+    for _ in range(op_count):
+        current_node = the_list.get_current_node()
+        the_node = current_node.next()
+        the_list.move_after(the_node.next().next(), the_node)
+        the_list.set_current_node(current_node.next())
+    return op_count / (time.perf_counter() - start_time)
+
+
+# main
+if __name__ == "__main__":
+    if DictNode(0, None, None).__dict__ == {}:
+        print(f"Problem here chief..")
+        exit(1)
+    for variant_name, list_class in variants:
+        bytes_per_node = measure_memory_per_node(list_class)
+        the_list = build_list(list_class, node_count)
+        remove_add_rate = measure_remove_add(the_list)
+        move_after_rate = measure_move_after(the_list)
+        print(
+            f"{variant_name:15} bytes/node={bytes_per_node:7.1f} "
+            f"remove+add ops/sec={remove_add_rate:10.0f} move_after ops/sec={move_after_rate:10.0f}"
+        )
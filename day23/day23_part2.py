@@ -99,6 +99,7 @@
 #
 
 from fast_circle_list import FastCircleList
+from successor_cups import SuccessorCrabCups
 
 
 class CrabCups:
@@ -126,15 +127,16 @@ class CrabCups:
             f"cups: min: {self.min_cup_id}, max: {self.max_cup_id}, count: {self.cups.item_count()}, current={self.cups.get_current_node()} {description}\n"
         )
 
-    def find_next_destination(self, current_cup: int):
+    def find_next_destination(self, current_cup: int, picked_up=()):
         """
         # The crab selects a destination cup: the cup with a label equal to the current cup's label minus one.
         # If this would select one of the cups that was just picked up, the crab will keep subtracting one until it finds a cup that wasn't just picked up.
         # If at any point in this process the value goes below the lowest value on any cup's label, it wraps around to the highest value on any cup's label instead.
+        picked up cups are still in the lookup while they're cut out, so they're passed in to be skipped
         """
         target_cup = current_cup - 1
         # keep going until we find a valid cup
-        while target_cup not in self.cups:
+        while target_cup not in self.cups or target_cup in picked_up:
             target_cup -= 1
             if target_cup < self.min_cup_id:
                 target_cup = self.max_cup_id
@@ -156,25 +158,22 @@ class CrabCups:
         if verbose:
             self.print("top of move")
 
-        # 1) grab three cups
-        c1 = self.cups.remove_next_node()
-        c2 = self.cups.remove_next_node()
-        c3 = self.cups.remove_next_node()
+        # 1) grab three cups as one run
+        picked_up_run = self.cups.cut_run(self.cups.get_current_node(), 3)
+        picked_up = self.cups.run_values(picked_up_run)
         if verbose:
-            print(f"pick up: {c1}, {c2}, {c3}")
+            print(f"pick up: {picked_up}")
             self.print("after pickup")
 
         # 2) find a destination cup
         destination_node = self.find_next_destination(
-            self.cups.get_current_node().value
+            self.cups.get_current_node().value, picked_up
         )
         if verbose:
             print(f"destination node is {destination_node}")
 
         # 3) insert cups back into the circle
-        self.cups.add_after(destination_node, c3.value)
-        self.cups.add_after(destination_node, c2.value)
-        self.cups.add_after(destination_node, c1.value)
+        self.cups.splice_run(picked_up_run, destination_node)
         if verbose:
             self.print("after adding cups..")
 
@@ -208,20 +207,31 @@ class CrabCups:
 
 
 # main
-
-games = [
-    ("389125467", 10000000, 149245887792),
-    ("589174263", 10000000, None),
-]
-
-for starting_position, required_iterations, expected_result in games:
-    c = CrabCups(starting_position)
-    c.print()
-    c.play(required_iterations)
-    actual = c.score()
-    print(
-        f"start: {starting_position}, iterations={required_iterations}, expected={expected_result}, actual={actual}"
-    )
-    if expected_result is not None and actual != expected_result:
-        print(f"Problem here chief..")
-        exit(1)
+if __name__ == "__main__":
+    games = [
+        ("389125467", 10000000, 149245887792),
+        ("589174263", 10000000, None),
+    ]
+
+    # "circle_list" is the original node-per-cup implementation,
+    # "successor_array" keeps one array slot per cup label
+    backends = {
+        "circle_list": CrabCups,
+        "successor_array": SuccessorCrabCups,
+    }
+    # the node list backend takes a good while for 10M moves, add it here to compare
+    backends_to_run = ["successor_array"]
+
+    for backend_name in backends_to_run:
+        backend = backends[backend_name]
+        for starting_position, required_iterations, expected_result in games:
+            c = backend(starting_position)
+            c.print()
+            c.play(required_iterations)
+            actual = c.score()
+            print(
+                f"backend: {backend_name}, start: {starting_position}, iterations={required_iterations}, expected={expected_result}, actual={actual}"
+            )
+            if expected_result is not None and actual != expected_result:
+                print(f"Problem here chief..")
+                exit(1)
@@ -4,7 +4,10 @@
 
 # a node, one item in the list
 # if knows the value that it stores and the previous and next items in the list
+# slotted so that a million of them don't each drag a __dict__ around
 class Node:
+    __slots__ = ("value", "previous_node", "next_node")
+
     def __init__(self, the_value, previous_node, next_node):
         self.value = the_value
         if previous_node is None:
@@ -37,9 +40,19 @@ class Node:
 
 
 class FastCircleList:
-    def __init__(self):
+    # the class used for new nodes, subclasses can swap this out
+    node_class = Node
+
+    def __init__(self, pool_nodes: bool = True):
+        """
+        if pool_nodes is set, removed nodes go onto a free list and are reused by the next add,
+        which is why the removes hand back the value rather than the node,
+        use detach_node / detach_next_node for a node that's going back in with move_after
+        """
         self.lookup = dict()
         self.current_node = None
+        self.pool_nodes = pool_nodes
+        self.node_pool = []
 
     def __contains__(self, item):
         return item in self.lookup
@@ -53,6 +66,9 @@ class FastCircleList:
     def min_value(self):
         return min(self.lookup.keys())
 
+    def pool_size(self):
+        return len(self.node_pool)
+
     def print(self, message=None, walk=None):
         s = ""
         if message is not None:
@@ -98,25 +114,31 @@ class FastCircleList:
 
     def remove_next_node(self, the_node=None):
         """
-        Given a starting node, remove the one after it and return it..
+        Given a starting node, remove the one after it and return its value..
         if the_node is None then we use the self.current_node value as a starting point
         """
         if the_node is None:
             the_node = self.current_node
-        the_node = the_node.next()
-        self.remove_node(the_node)
-        return the_node
+        return self.remove_node(the_node.next())
 
-    def remove_node(self, the_node):
+    def detach_next_node(self, the_node=None):
         """
-        Remove the mentioned node from the collection, returning the removed node or
+        Like remove_next_node, but the node is only detached (see detach_node)
+        """
+        if the_node is None:
+            the_node = self.current_node
+        return self.detach_node(the_node.next())
+
+    def detach_node(self, the_node):
+        """
+        Take the mentioned node out of the collection and return it, it never goes in the pool
+        so it keeps its value and can be put back with move_after
         """
-        the_value = the_node.value
         next_node = the_node.next()
         prev_node = the_node.previous()
         next_node.set_prev(prev_node)
         prev_node.set_next(next_node)
-        del self.lookup[the_value]
+        del self.lookup[the_node.value]
 
         # make sure we're not pointing at an orphan
         if self.current_node == the_node:
@@ -124,6 +146,117 @@ class FastCircleList:
 
         return the_node
 
+    def remove_node(self, the_node):
+        """
+        Remove the mentioned node from the collection for good, returning its value
+        with pool_nodes set the node gets reused (value and all) by the next add
+        """
+        self.detach_node(the_node)
+
+        # keep it for later rather than letting it go
+        if self.pool_nodes:
+            self.node_pool.append(the_node)
+
+        return the_node.value
+
+    def is_in_list(self, the_node):
+        """
+        True if the node is the one the lookup has for its value, rather than a detached one
+        """
+        return self.lookup.get(the_node.value) is the_node
+
+    def move_after(self, target_node, the_node):
+        """
+        Move a node so it sits directly after target_node, the node can already be in the list
+        (only the pointers get updated) or be one from detach_node (it goes back in the lookup),
+        removed nodes belong to the pool so they can't come back this way
+        """
+        if the_node is target_node or target_node.next_node is the_node:
+            return the_node
+
+        if self.is_in_list(the_node):
+            # 1) unlink it from where it is now
+            prev_node = the_node.previous_node
+            next_node = the_node.next_node
+            prev_node.next_node = next_node
+            next_node.previous_node = prev_node
+            if self.current_node is the_node:
+                self.current_node = next_node
+        else:
+            # 1) a detached node coming back in
+            if the_node.value in self.lookup:
+                raise ValueError(f"{the_node.value} is already in the list")
+            self.lookup[the_node.value] = the_node
+
+        # 2) and link it back in after the target
+        after_node = target_node.next_node
+        the_node.previous_node = target_node
+        the_node.next_node = after_node
+        target_node.next_node = the_node
+        after_node.previous_node = the_node
+
+        return the_node
+
+    def cut_run(self, after_node, n):
+        """
+        Cut the n nodes following after_node out of the circle and return them as a (first_node, last_node) run
+        the run stays linked internally and the nodes stay in the lookup, so this only rewires the two ends
+        """
+        first_node = after_node.next_node
+        last_node = first_node
+        moves_current = last_node is self.current_node
+        for _ in range(n - 1):
+            last_node = last_node.next_node
+            if last_node is self.current_node:
+                moves_current = True
+
+        # close the gap
+        next_node = last_node.next_node
+        after_node.next_node = next_node
+        next_node.previous_node = after_node
+
+        # make sure we're not pointing into the run
+        if moves_current:
+            self.current_node = next_node
+
+        return first_node, last_node
+
+    def splice_run(self, run, after_node):
+        """
+        Put a run from cut_run back into the circle directly after after_node
+        """
+        first_node, last_node = run
+        next_node = after_node.next_node
+        after_node.next_node = first_node
+        first_node.previous_node = after_node
+        last_node.next_node = next_node
+        next_node.previous_node = last_node
+
+    def run_values(self, run):
+        """
+        Return the values held in a run from cut_run, first to last
+        """
+        first_node, last_node = run
+        result = [first_node.value]
+        this_node = first_node
+        while this_node is not last_node:
+            this_node = this_node.next_node
+            result.append(this_node.value)
+        return result
+
+    def new_node(self, item, previous_node, next_node):
+        """
+        Make a node for item, reusing one from the pool if we have one
+        """
+        if self.node_pool:
+            the_node = self.node_pool.pop()
+            the_node.value = item
+            the_node.previous_node = the_node if previous_node is None else previous_node
+            the_node.next_node = the_node if next_node is None else next_node
+        else:
+            the_node = self.node_class(item, previous_node, next_node)
+        return the_node
+
     def print_list(self):
         start = self.current_node
         s = str(start)
@@ -175,13 +308,13 @@ class FastCircleList:
             # find the current next node
             prev_node = target_node.previous()
             # create a new node sitting between these two
-            new_node = Node(item, prev_node, target_node)
+            new_node = self.new_node(item, prev_node, target_node)
             # fix the pointers in those nodes to point at the new node
             target_node.set_prev(new_node)
             prev_node.set_next(new_node)
         else:
             # first time adding a node.. so..
-            new_node = Node(item, None, None)
+            new_node = self.new_node(item, None, None)
             self.current_node = new_node
 
         # and whatever the case, we need to add the value to the quick lookup
@@ -199,13 +332,13 @@ class FastCircleList:
             # find the current next node
             next_node = target_node.next()
             # create a new node sitting between these two
-            new_node = Node(item, target_node, next_node)
+            new_node = self.new_node(item, target_node, next_node)
             # fix the pointers in those nodes to point at the new node
             target_node.set_next(new_node)
             next_node.set_prev(new_node)
         else:
             # first time adding a node.. so..
-            new_node = Node(item, None, None)
+            new_node = self.new_node(item, None, None)
             self.current_node = new_node
 
         # and whatever the case, we need to add the value to the quick lookup
@@ -255,3 +388,58 @@ if __name__ == "__main__":
     print(f"removed these values: {cut_values}")
     l.print("after removal")
     l.print_list()
+
+    # those three should come back out of the pool
+    print(f"pool size before re-adding: {l.pool_size()}")
+    for x in ("x", "y", "z"):
+        l.add_after(target_node, x)
+    l.print(f"after re-adding, pool size: {l.pool_size()}")
+    l.print_list()
+
+    # cut a run of 3 after "3" and paste it back after "frog"
+    run = l.cut_run(l.locate_node(3), 3)
+    print(f"cut run: {l.run_values(run)}")
+    l.print("after cutting the run")
+    l.print_list()
+    l.splice_run(run, l.locate_node("frog"))
+    l.print("after splicing the run after frog")
+    l.print_list()
+
+    # and move a node without touching the lookup
+    l.move_after(l.locate_node(9), l.locate_node("x"))
+    l.print("moved x after 9")
+    l.print_list()
+
+    # round trip, detach nodes and put them back with move_after
+    item_count = l.item_count()
+    detached_y = l.detach_node(l.locate_node("y"))
+    detached_z = l.detach_next_node(l.locate_node("frog"))
+    removed_value = l.remove_item(7)
+    if (
+        l.locate_node("y") is not None
+        or l.locate_node("z") is not None
+        or detached_z.value != "z"
+        or removed_value != 7
+        or l.item_count() != item_count - 3
+        or l.pool_size() != 1
+    ):
+        print(f"Problem here chief..")
+        exit(1)
+    # w gets 7's old node from the pool, the detached ones were never in it
+    w_node = l.add_after(l.locate_node("frog"), "w")
+    l.move_after(l.locate_node(0), detached_y)
+    l.move_after(l.locate_node(1), detached_z)
+    l.print(f"moved y after 0, z after 1 and added w, pool size: {l.pool_size()}")
+    l.print_list()
+    if (
+        l.locate_node("y") is not detached_y
+        or l.locate_node("z") is not detached_z
+        or l.locate_node("w") is not w_node
+        or (detached_y.value, detached_z.value) != ("y", "z")
+        or detached_y.previous() is not l.locate_node(0)
+        or detached_z.previous() is not l.locate_node(1)
+        or l.item_count() != item_count
+        or l.pool_size() != 0
+    ):
+        print(f"Problem here chief..")
+        exit(1)
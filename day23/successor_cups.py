@@ -0,0 +1,140 @@
+#
+#  A flat successor-array backend for the crab cups game
+#
+#  Cup labels are 1..N so we can index a single array by label where
+#  next_cup[label] is the label of the cup immediately clockwise of it.
+#  A move is then just three writes into that array, nothing is allocated
+#  and the whole million-cup circle fits in about 4MB.
+#
+from array import array
+
+
+class SuccessorCrabCups:
+    def __init__(self, initial_configuration: str, total_cups: int = 1000000):
+        labels = [int(x) for x in initial_configuration.strip()]
+        # now add the other cups up to total_cups
+        labels.extend(range(max(labels) + 1, total_cups + 1))
+
+        self.min_cup_id = min(labels)
+        self.max_cup_id = max(labels)
+        self.cup_count = len(labels)
+
+        # slot 0 is never used, labels start at 1
+        self.next_cup = array("I", bytes(4 * (self.max_cup_id + 1)))
+        for this_label, next_label in zip(labels, labels[1:]):
+            self.next_cup[this_label] = next_label
+        self.next_cup[labels[-1]] = labels[0]
+
+        self.current_cup = labels[0]
+
+    def walk(self, start_cup: int, steps: int):
+        """
+        Return the labels of start_cup and the steps-1 cups clockwise of it
+        """
+        result = []
+        this_cup = start_cup
+        for _ in range(steps):
+            result.append(this_cup)
+            this_cup = self.next_cup[this_cup]
+        return result
+
+    def print(self, desc: str = None):
+
+        description = ""
+        if desc is not None:
+            description = desc
+
+        print(
+            f"cups: min: {self.min_cup_id}, max: {self.max_cup_id}, count: {self.cup_count}, current={self.current_cup} {description}"
+        )
+        print(f"Walking forwards for 20 steps: {self.walk(self.current_cup, 20)}\n")
+
+    def play_one_move(self):
+        """
+        Make one move in the cup game, see CrabCups.play_one_move for the rules
+        """
+        next_cup = self.next_cup
+        current_cup = self.current_cup
+
+        # 1) grab three cups, they stay linked to each other
+        c1 = next_cup[current_cup]
+        c2 = next_cup[c1]
+        c3 = next_cup[c2]
+
+        # 2) find a destination cup
+        destination_cup = current_cup - 1
+        while True:
+            if destination_cup < self.min_cup_id:
+                destination_cup = self.max_cup_id
+            if destination_cup != c1 and destination_cup != c2 and destination_cup != c3:
+                break
+            destination_cup -= 1
+
+        # 3) cut the run out and splice it back in after the destination
+        next_cup[current_cup] = next_cup[c3]
+        next_cup[c3] = next_cup[destination_cup]
+        next_cup[destination_cup] = c1
+
+        # 4) select the next cup
+        self.current_cup = next_cup[current_cup]
+
+    def play(self, moves: int):
+        # the same logic as play_one_move but with everything held in locals
+        # as this is the loop that runs 10 million times
+        next_cup = self.next_cup
+        current_cup = self.current_cup
+        min_cup_id = self.min_cup_id
+        max_cup_id = self.max_cup_id
+
+        for move_no in range(1, moves + 1):
+            if move_no % 250000 == 0:
+                print(f"-- move {move_no} --")
+
+            c1 = next_cup[current_cup]
+            c2 = next_cup[c1]
+            c3 = next_cup[c2]
+
+            destination_cup = current_cup - 1
+            while True:
+                if destination_cup < min_cup_id:
+                    destination_cup = max_cup_id
+                if (
+                    destination_cup != c1
+                    and destination_cup != c2
+                    and destination_cup != c3
+                ):
+                    break
+                destination_cup -= 1
+
+            next_cup[current_cup] = next_cup[c3]
+            next_cup[c3] = next_cup[destination_cup]
+            next_cup[destination_cup] = c1
+
+            current_cup = next_cup[current_cup]
+
+        self.current_cup = current_cup
+
+    def score(self):
+        """
+        Multiply the 2 cup numbers directly to the left of the #1 cup
+        """
+        a = self.next_cup[1]
+        b = self.next_cup[a]
+        return a * b
+
+
+# main, some simple testing..
+if __name__ == "__main__":
+    # the part 1 example, 10 moves on just the 9 cups
+    c = SuccessorCrabCups("389125467", total_cups=9)
+    c.print("start")
+    c.play(10)
+    c.print("after 10 moves")
+    after_one = "".join(str(x) for x in c.walk(1, 9)[1:])
+    print(f"after 10 moves: expected=92658374, actual={after_one}")
+
+    c = SuccessorCrabCups("389125467", total_cups=9)
+    for _ in range(100):
+        c.play_one_move()
+    after_one = "".join(str(x) for x in c.walk(1, 9)[1:])
+    print(f"after 100 moves: expected=67384529, actual={after_one}")
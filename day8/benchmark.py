@@ -0,0 +1,184 @@
+#
+#  Benchmark TheMachine against the CompiledMachine on long made up programs
+#
+#  The programs are random acc / nop with short forward jumps, so most of the code actually
+#  runs. The "looping" ones get a jmp back to the start tacked on the end, so they run the
+#  whole thing and then hit the loop detection. Before that lots of little programs with jumps
+#  all over the place (backwards, off either end) check the two machines agree on how they end,
+#  including after some pokes into copies of an already compiled machine.
+#
+#  Each long program is timed twice, one run (with the compile counted against the compiled
+#  machine) and the part 2 search, flipping a few jmp / nop's and running a poked copy for each.
+#
+import random
+import time
+
+from day8_part2 import TheMachine
+
+program_lengths = [10000, 100000, 1000000]
+small_program_count = 20000
+flip_count = 20
+
+
+def random_program(program_length, looping=False, seed=2020):
+    rng = random.Random(seed)
+    instructions = []
+    for _ in range(program_length - 1):
+        operation = rng.choice(("acc", "acc", "nop", "jmp"))
+        if "jmp" == operation:
+            int_param = rng.randint(1, 3)
+        else:
+            int_param = rng.randint(-100, 100)
+        instructions.append((operation, int_param))
+    instructions.append(("jmp", -(program_length - 1)) if looping else ("nop", 0))
+    return instructions
+
+
+def random_small_program(rng):
+    instructions = []
+    for _ in range(rng.randint(1, 12)):
+        operation = rng.choice(("acc", "nop", "jmp"))
+        int_param = rng.randint(-6, 6)
+        instructions.append((operation, int_param))
+    return instructions
+
+
+def same_as_the_machine(instructions, start_location=0):
+    the_machine = TheMachine()
+    the_machine.instructions = instructions
+    the_machine.instruction_pointer = start_location
+    compiled = the_machine.compile()
+    result = the_machine.run()
+    compiled_result = compiled.run()
+    return (
+        result == compiled_result
+        and the_machine.accumulator == compiled.accumulator
+        and the_machine.instruction_pointer == compiled.instruction_pointer
+        and len(the_machine.halting_list) == compiled.instructions_executed
+    )
+
+
+def same_after_pokes(instructions, rng):
+    """
+    Poke copies of a machine that has already run (so poke has to patch its stretches)
+    """
+    the_machine = TheMachine()
+    the_machine.instructions = instructions
+    compiled = the_machine.compile()
+    compiled.run()
+    for _ in range(3):
+        location = rng.randrange(len(instructions))
+        operation = rng.choice(("acc", "nop", "jmp"))
+        int_param = rng.randint(-6, 6)
+        machine_copy = the_machine.copy()
+        machine_copy.poke(location, operation, int_param)
+        compiled_copy = compiled.copy()
+        compiled_copy.reset()
+        compiled_copy.poke(location, operation, int_param)
+        if (machine_copy.run(), machine_copy.accumulator) != (
+            compiled_copy.run(),
+            compiled_copy.accumulator,
+        ):
+            return False
+        the_machine, compiled = machine_copy, compiled_copy
+        the_machine.reset()
+        compiled.reset()
+    # and the copies mustn't have changed the machine they came from
+    return same_as_the_machine(instructions)
+
+
+def flip_search(the_machine, locations):
+    """
+    The part 2 search, for each location flip the jmp / nop in a copy and run it
+    """
+    results = []
+    for location in locations:
+        operation, int_param = the_machine.peek(location)
+        new_machine = the_machine.copy()
+        new_machine.poke(location, "nop" if "jmp" == operation else "jmp", int_param)
+        results.append((new_machine.run(), new_machine.accumulator))
+    return results
+
+
+def compare(description, instructions):
+    the_machine = TheMachine()
+    the_machine.instructions = instructions
+    start_time = time.perf_counter()
+    result, result_desc = the_machine.run()
+    machine_time = time.perf_counter() - start_time
+    machine_executed = len(the_machine.halting_list)
+
+    start_time = time.perf_counter()
+    fresh_machine = TheMachine()
+    fresh_machine.instructions = instructions
+    compiled = fresh_machine.compile()
+    compiled.build_stretches()
+    compile_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    compiled_result, compiled_desc = compiled.run()
+    compiled_time = time.perf_counter() - start_time
+
+    same = (
+        result == compiled_result
+        and result_desc == compiled_desc
+        and the_machine.accumulator == compiled.accumulator
+        and machine_executed == compiled.instructions_executed
+    )
+    print(
+        f"{description:28} {machine_executed:8} executed "
+        f"machine={machine_executed / machine_time:11.0f} instructions/sec "
+        f"compiled={compiled.instructions_executed / compiled_time:11.0f} instructions/sec "
+        f"(compile {compile_time:.3f}s) x{machine_time / (compile_time + compiled_time):.1f} "
+        f"(run only x{machine_time / compiled_time:.1f}) same={same}"
+    )
+    if not same:
+        print(f"Problem here chief..")
+        exit(1)
+
+    # the part 2 search, the compile is done once and counted
+    the_machine.reset()
+    flippable = [
+        location
+        for location, (operation, _) in enumerate(instructions)
+        if operation in ("jmp", "nop")
+    ]
+    locations = flippable[:: max(1, len(flippable) // flip_count)][:flip_count]
+    start_time = time.perf_counter()
+    machine_results = flip_search(the_machine, locations)
+    machine_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    compiled = fresh_machine.compile()
+    compiled.build_stretches()
+    compiled_results = flip_search(compiled, locations)
+    compiled_time = time.perf_counter() - start_time
+    same = machine_results == compiled_results
+    print(
+        f"{description:28} {len(locations):8} flips    "
+        f"machine={machine_time / len(locations):8.4f}s per flip   "
+        f"compiled={compiled_time / len(locations):8.4f}s per flip, compile included "
+        f"x{machine_time / compiled_time:.1f} same={same}"
+    )
+    if not same:
+        print(f"Problem here chief..")
+        exit(1)
+
+
+# main
+if __name__ == "__main__":
+    rng = random.Random(2020)
+    for _ in range(small_program_count):
+        instructions = random_small_program(rng)
+        start_location = rng.randint(0, len(instructions))
+        if not same_as_the_machine(
+            instructions, start_location
+        ) or not same_after_pokes(instructions, rng):
+            print(f"{instructions} from {start_location}")
+            print(f"Problem here chief..")
+            exit(1)
+    print(f"{small_program_count} small programs, same result from both machines")
+
+    for program_length in program_lengths:
+        compare(f"{program_length} terminating", random_program(program_length))
+        compare(
+            f"{program_length} looping", random_program(program_length, looping=True)
+        )
@@ -0,0 +1,243 @@
+#
+#  A compiled version of TheMachine
+#
+#  The (operation, int_param) instructions become two parallel arrays, an int opcode and its
+#  argument. Between jmps the code just runs straight down (acc and nop always go to the next
+#  instruction), so run() doesn't bother stepping through those one at a time, from each
+#  location we know where the next jmp is and how much the accumulator goes up by getting there.
+#  The run loop is then one jump per stretch of code, marking the jmp at the end of each stretch
+#  in a visited bytearray, if we come back to an already visited jmp we're looping.
+#
+#  Jumps that go off the end (or before the start) of the code go to an extra location past the
+#  end, which like the end of the code itself is marked visited so the loop stops there, and
+#  sorts out which of the three ways it finished afterwards.
+#
+#  Compiling has to look at every instruction, which costs about as much as TheMachine running
+#  the program once, so the win is in running the same code lots of times. poke only redoes the
+#  stretch it lands in, so the part 2 copy / poke / run search doesn't compile again each time.
+#
+from array import array
+from operator import itemgetter
+
+OP_NOP = 0
+OP_ACC = 1
+OP_JMP = 2
+
+opcode_numbers = {"nop": OP_NOP, "acc": OP_ACC, "jmp": OP_JMP}
+operation_names = ("nop", "acc", "jmp")
+
+
+class CompiledMachine:
+    def __init__(self, instructions):
+        """
+        instructions is the list of (operation, int_param) from TheMachine
+        """
+        try:
+            self.opcodes = bytearray(
+                map(opcode_numbers.__getitem__, map(itemgetter(0), instructions))
+            )
+        except KeyError:
+            self.opcodes = None
+        if self.opcodes is None:
+            for location, (operation, _) in enumerate(instructions):
+                if operation not in opcode_numbers:
+                    raise RuntimeError(
+                        f"Instruction not implemented: {operation} at {location}"
+                    )
+        self.arguments = array("q", map(itemgetter(1), instructions))
+        self.stretches = None
+        self.reset()
+
+    def reset(self):
+        self.accumulator = 0
+        self.instruction_pointer = 0
+        self.instructions_executed = 0
+
+    def copy(self):
+        duplicate = CompiledMachine([])
+        duplicate.opcodes = self.opcodes[:]
+        duplicate.arguments = self.arguments[:]
+        if self.stretches is not None:
+            # poke changes these in place, so the copy needs its own
+            duplicate.stretches = tuple(table[:] for table in self.stretches)
+        duplicate.accumulator = self.accumulator
+        duplicate.instruction_pointer = self.instruction_pointer
+        duplicate.instructions_executed = self.instructions_executed
+        return duplicate
+
+    def get_code_length(self):
+        return len(self.opcodes)
+
+    def peek(self, location=None):
+        """
+        return the operation, int_param pair at a given location or the current instruction
+        """
+        if location is None:
+            location = self.instruction_pointer
+        if location < 0 or location >= len(self.opcodes):
+            raise ValueError(
+                f"unable to peek at {location}, there are only {len(self.opcodes)} instructions in the codebase"
+            )
+        return operation_names[self.opcodes[location]], self.arguments[location]
+
+    def poke(self, location, operation, int_param):
+        """
+        Set a particular instruction (only supports inside the current address space for now)
+        """
+        if location < 0 or location >= len(self.opcodes):
+            raise ValueError(
+                f"unable to poke at {location}, there are only {len(self.opcodes)} instructions in the codebase"
+            )
+        if operation not in opcode_numbers:
+            raise RuntimeError(f"Instruction not implemented: {operation}")
+        self.opcodes[location] = opcode_numbers[operation]
+        self.arguments[location] = int_param
+        if self.stretches is not None:
+            self.update_stretch(location)
+
+    def build_stretches(self):
+        """
+        Work backwards through the code to get, for every location, where the stretch of code it's
+        in ends (the next jmp, or the end of the code) and what the acc's add up to on the way,
+        plus where each jmp ends up. Plain lists as they're quicker to index than arrays.
+        """
+        code_length = len(self.opcodes)
+        off_the_end = code_length + 1
+        stretch_end = [0] * code_length + [code_length, off_the_end]
+        stretch_acc = [0] * (code_length + 2)
+        jump_to = [0] * code_length
+
+        end = code_length
+        total = 0
+        for location, opcode, argument in zip(
+            range(code_length - 1, -1, -1),
+            reversed(self.opcodes),
+            reversed(self.arguments),
+        ):
+            if OP_JMP == opcode:
+                end = location
+                total = 0
+                target = location + argument
+                jump_to[location] = target if 0 <= target <= code_length else off_the_end
+            elif OP_ACC == opcode:
+                total += argument
+            stretch_end[location] = end
+            stretch_acc[location] = total
+        self.stretches = (stretch_end, stretch_acc, jump_to)
+
+    def jump_target(self, location):
+        """
+        Where the jmp at location goes, anywhere outside the code is the location past the end
+        (the same as build_stretches works out for every jmp)
+        """
+        code_length = len(self.opcodes)
+        target = location + self.arguments[location]
+        return target if 0 <= target <= code_length else code_length + 1
+
+    def update_stretch(self, location):
+        """
+        After a poke, redo the stretch tables from the jmp before location up to the next jmp,
+        the rest of the code is the same as it was
+        """
+        stretch_end, stretch_acc, jump_to = self.stretches
+        opcodes = self.opcodes
+        start = opcodes.rfind(OP_JMP, 0, location) + 1
+        end = opcodes.find(OP_JMP, location)
+        if end < 0:
+            end = len(opcodes)
+        else:
+            jump_to[end] = self.jump_target(end)
+        stretch_end[end] = end
+        stretch_acc[end] = 0
+
+        total = 0
+        for this_location in range(end - 1, start - 1, -1):
+            if OP_ACC == opcodes[this_location]:
+                total += self.arguments[this_location]
+            stretch_end[this_location] = end
+            stretch_acc[this_location] = total
+
+    def run(self, verbose=False):
+        """
+        Run the program from the current location until it loops, jumps off somewhere silly or
+        finishes by running off the end, returns (result, result_description) like TheMachine.run
+        """
+        code_length = len(self.opcodes)
+        instruction_pointer = self.instruction_pointer
+        if instruction_pointer < 0 or instruction_pointer > code_length:
+            result_description = (
+                f"invalid instruction pointer location {instruction_pointer}"
+            )
+            if verbose:
+                print(f"well that failed: {result_description}")
+            return False, result_description
+        if self.stretches is None:
+            self.build_stretches()
+        stretch_end, stretch_acc, jump_to = self.stretches
+
+        visited = bytearray(code_length + 2)
+        visited[code_length] = 1
+        visited[code_length + 1] = 1
+        accumulator = self.accumulator
+        entry_points = []
+        add_entry_point = entry_points.append
+
+        end = stretch_end[instruction_pointer]
+        while not visited[end]:
+            visited[end] = 1
+            add_entry_point(instruction_pointer)
+            accumulator += stretch_acc[instruction_pointer]
+            instruction_pointer = jump_to[end]
+            end = stretch_end[instruction_pointer]
+
+        # every stretch we went all the way through, entry point to jmp
+        executed = (
+            sum(map(stretch_end.__getitem__, entry_points))
+            - sum(entry_points)
+            + len(entry_points)
+        )
+        if instruction_pointer > code_length:
+            last_jump = stretch_end[entry_points[-1]]
+            instruction_pointer = last_jump + self.arguments[last_jump]
+            result, result_description = (
+                False,
+                f"invalid instruction pointer location {instruction_pointer}",
+            )
+        elif end == code_length:
+            accumulator += stretch_acc[instruction_pointer]
+            executed += code_length - instruction_pointer
+            instruction_pointer = code_length
+            result, result_description = True, "Natural program completion"
+        else:
+            # we've been down the end of this stretch before, the first instruction we'd repeat is
+            # wherever we came in last time or where we've come in now, whichever is later
+            earlier_entry_point = next(
+                location for location in entry_points if stretch_end[location] == end
+            )
+            repeated = max(instruction_pointer, earlier_entry_point)
+            accumulator += stretch_acc[instruction_pointer] - stretch_acc[repeated]
+            executed += repeated - instruction_pointer
+            instruction_pointer = repeated
+            result, result_description = (
+                False,
+                f"Infinite looping detected at {instruction_pointer}",
+            )
+
+        self.accumulator = accumulator
+        self.instruction_pointer = instruction_pointer
+        self.instructions_executed = executed
+        if verbose and not result:
+            print(f"well that failed: {result_description}")
+        return result, result_description
+
+    def print_state(self):
+        """
+        Dump the entire state of the machine to stdout
+        """
+        print(f"Machine State")
+        print(f"-------------")
+        print(f"Accumulator: {self.accumulator}")
+        print(f"Instruction Pointer: {self.instruction_pointer}")
+        print(f"instructions executed: {self.instructions_executed}")
+        print(f"program code: {len(self.opcodes)} instructions")
+        print(f"")
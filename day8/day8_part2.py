@@ -89,6 +89,8 @@
 # brute-force would be easy, simply flip each of the instructions mentioned in the code and run the program, not very elegant though..
 # might be a good starter for 10 though..
 
+from compiled_machine import CompiledMachine
+
 
 # yay, IntCode2 - son of IntCode
 class TheMachine:
@@ -112,6 +114,15 @@ class TheMachine:
     def get_code_length(self):
         return len(self.instructions)
 
+    def compile(self):
+        """
+        Return a CompiledMachine (int opcodes, visited bytearray) running the same code from the same place
+        """
+        result = CompiledMachine(self.instructions)
+        result.accumulator = self.accumulator
+        result.instruction_pointer = self.instruction_pointer
+        return result
+
     def peek(self, location=None):
         """
         return the operation, int_param pair at a given location or the current instruction
@@ -268,22 +279,26 @@ class TheMachine:
 
 
 # main program
-filename = "input.txt"
-the_machine = TheMachine()
-the_machine.load_program_from_file(filename)
-
-for this_address in range(the_machine.get_code_length()):
-    operation, int_param = the_machine.peek(this_address)
-    # print(f"{this_address} -> {operation}, {int_param}")
-    if operation in ("nop", "jmp"):
-        if operation == "nop":
-            operation = "jmp"
-        else:
-            operation = "nop"
-        new_machine = the_machine.copy()
-        new_machine.poke(this_address, operation, int_param)
-        result, result_desc = new_machine.run(verbose=False)
-        print(f"flipped {this_address} -> {result_desc}")
-        if result:
-            new_machine.print_state()
-            break
+if __name__ == "__main__":
+    filename = "input.txt"
+    the_machine = TheMachine()
+    the_machine.load_program_from_file(filename)
+    use_compiled = True
+    if use_compiled:
+        the_machine = the_machine.compile()
+
+    for this_address in range(the_machine.get_code_length()):
+        operation, int_param = the_machine.peek(this_address)
+        # print(f"{this_address} -> {operation}, {int_param}")
+        if operation in ("nop", "jmp"):
+            if operation == "nop":
+                operation = "jmp"
+            else:
+                operation = "nop"
+            new_machine = the_machine.copy()
+            new_machine.poke(this_address, operation, int_param)
+            result, result_desc = new_machine.run(verbose=False)
+            print(f"flipped {this_address} -> {result_desc}")
+            if result:
+                new_machine.print_state()
+                break